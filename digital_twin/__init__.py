@@ -16,6 +16,8 @@ __version__ = "0.2.0"
 __author__ = "Digital Twin Team"
 __description__ = "Fleet Decarbonization Analysis - Digital Twin"
 
+import importlib as _importlib
+
 # Layer 1: Foundation - Core types and utilities
 from digital_twin.core import (
     VehicleType,
@@ -80,10 +82,31 @@ from digital_twin.algorithms import (
 )
 
 # Layer 5: Interface - Visualization and API
-from digital_twin.visualization import (
-    create_bar_chart,
-    generate_full_report,
-)
+# Loaded on first access: the chart module pulls in matplotlib
+_LAZY = {
+    "create_bar_chart": "digital_twin.visualization",
+    "generate_full_report": "digital_twin.visualization",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY.get(name)
+    if module_path is not None:
+        value = getattr(_importlib.import_module(module_path), name)
+    else:
+        # Not-yet-imported submodules stay reachable as attributes
+        submodule = f"{__name__}.{name}"
+        try:
+            value = _importlib.import_module(submodule)
+        except ModuleNotFoundError as exc:
+            if exc.name != submodule:
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Version info
@@ -1,11 +1,11 @@
 """Dynamic fleet optimization algorithm."""
 
-from digital_twin.optimization import optimize_fleet_composition
-
 
 def optimize_fleet(fleet_data: dict, constraints: dict) -> dict:
     """Optimize fleet composition dynamically."""
     import numpy as np
+    from digital_twin.optimization import optimize_fleet_composition
+
     cost_matrix = np.array([[1, 2], [3, 4]])
     return optimize_fleet_composition(cost_matrix, constraints)
 
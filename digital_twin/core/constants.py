@@ -85,6 +85,12 @@ FAST_CHARGER_POWER_KW = 350  # kW
 H2_STATION_CAPACITY_KG_DAY = 1000  # kg/day
 GRID_CONNECTION_COST_PER_KW = 500  # AUD per kW
 
+# Integer technology codes for batch (vectorized) calculations
+TECH_BEV = 0
+TECH_FCET = 1
+TECH_DIESEL = 2
+TECH_HYBRID = 3
+
 __all__ = [
     "GRAVITY_ACCELERATION",
     "AIR_DENSITY_SEA_LEVEL",
@@ -108,4 +114,8 @@ __all__ = [
     "TYPICAL_TRUCK_MASS_KG",
     "TYPICAL_ANNUAL_KM",
     "DEFAULT_N_SIMULATIONS",
+    "TECH_BEV",
+    "TECH_FCET",
+    "TECH_DIESEL",
+    "TECH_HYBRID",
 ]
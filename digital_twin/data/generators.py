@@ -5,7 +5,10 @@ This module provides functions to create realistic vehicle specifications
 and fleet data for decarbonization analysis.
 """
 
-from typing import List, Dict, Any
+from dataclasses import replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping
 from digital_twin.core.models import VehicleSpecs, OperationalProfile, FinancialParams
 from digital_twin.core.types import VehicleType, FuelType, TechnologyType
 
@@ -176,15 +179,40 @@ def create_hybrid_specs() -> VehicleSpecs:
     )
 
 
-def create_base_technologies() -> Dict[str, VehicleSpecs]:
+def create_base_technologies(copy: bool = True) -> Mapping[str, VehicleSpecs]:
     """
     Create all base technology specifications.
 
+    Parameters
+    ----------
+    copy : bool
+        If True (default), return a new dict of new VehicleSpecs that the
+        caller may modify freely. If False, return a shared read-only
+        mapping built on first use.
+
     Returns
     -------
-    dict
-        Dictionary mapping technology names to VehicleSpecs
+    dict or Mapping
+        Mapping of technology names to VehicleSpecs
+
+    Notes
+    -----
+    The copies are made with dataclasses.replace from cached templates,
+    skipping the spec factories. ``copy=False`` allocates nothing at all
+    and suits read-only use in sensitivity or Monte Carlo loops; its
+    VehicleSpecs are shared by every such caller and must not be modified.
     """
+    if not copy:
+        return _base_technologies_view()
+    # metadata is the only mutable field; copy it so edits stay local
+    return {
+        name: replace(spec, metadata=dict(spec.metadata))
+        for name, spec in _base_technologies_view().items()
+    }
+
+
+def _build_base_technologies() -> Dict[str, VehicleSpecs]:
+    """Build a new dict of the base technology specifications."""
     return {
         "Diesel": create_diesel_baseline(),
         "BEV": create_bev_specs(),
@@ -193,6 +221,12 @@ def create_base_technologies() -> Dict[str, VehicleSpecs]:
     }
 
 
+@lru_cache(maxsize=1)
+def _base_technologies_view() -> Mapping[str, VehicleSpecs]:
+    """Shared read-only view of the base technology specifications."""
+    return MappingProxyType(_build_base_technologies())
+
+
 def create_base_operational_profile() -> OperationalProfile:
     """
     Create default operational profile based on Queensland trials.
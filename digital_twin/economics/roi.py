@@ -12,8 +12,10 @@ Economic ROI Model with Risk Assessment:
 Context: Operators face 2-4x higher upfront costs with break-even periods of 4-5 years
 """
 
+import math
 import numpy as np
-from typing import List, Optional
+from typing import List, Optional, Union
+from functools import lru_cache
 from digital_twin.core.constants import DEFAULT_DISCOUNT_RATE
 
 
@@ -41,10 +43,12 @@ def calculate_npv(
     float
         Net Present Value
     """
-    npv = -initial_investment
-    for t, cashflow in enumerate(annual_cashflows, start=1):
-        npv += cashflow / ((1 + discount_rate) ** t)
-    return npv
+    # Horner's scheme: one multiply per cashflow, no powers
+    inv = 1.0 / (1.0 + discount_rate)
+    acc = 0.0
+    for cashflow in reversed(annual_cashflows):
+        acc = (acc + cashflow) * inv
+    return acc - initial_investment
 
 
 def calculate_irr(
@@ -76,9 +80,12 @@ def calculate_irr(
         npv = -initial_investment
         npv_derivative = 0
 
+        inv = 1.0 / (1.0 + irr)
+        discount = 1.0
         for t, cf in enumerate(annual_cashflows, start=1):
-            npv += cf / ((1 + irr) ** t)
-            npv_derivative -= t * cf / ((1 + irr) ** (t + 1))
+            discount *= inv
+            npv += cf * discount
+            npv_derivative -= t * cf * discount * inv
 
         if abs(npv) < 0.01:  # Converged
             return irr
@@ -166,10 +173,12 @@ def calculate_risk_adjusted_npv(
     ----------
     initial_investment : float
         Initial investment (2-4x diesel cost typical)
-    annual_cashflows : list of float
-        Expected cash flow at each time period
-    cashflow_variances : list of float
-        Variance in cash flows (performance uncertainty)
+    annual_cashflows : list of float or np.ndarray
+        Expected cash flow at each time period. A 2-D array of shape
+        (n_scenarios, T) evaluates all scenarios in one call.
+    cashflow_variances : list of float or np.ndarray
+        Variance in cash flows (performance uncertainty), broadcast
+        against annual_cashflows.
         Typically 0.03-0.10 representing 3-10% variance
     discount_rate : float
         Risk-free discount rate (8% default)
@@ -179,8 +188,8 @@ def calculate_risk_adjusted_npv(
 
     Returns
     -------
-    float
-        Risk-adjusted NPV
+    float or np.ndarray
+        Risk-adjusted NPV (one value per scenario for 2-D cashflows)
 
     Notes
     -----
@@ -198,25 +207,28 @@ def calculate_risk_adjusted_npv(
     >>> calculate_risk_adjusted_npv(initial_inv, cashflows, variances, 0.08, 0.5)
     # Returns risk-adjusted NPV accounting for uncertainty
     """
-    if len(annual_cashflows) != len(cashflow_variances):
+    cashflows = np.asarray(annual_cashflows, dtype=np.float64)
+    variances = np.asarray(cashflow_variances, dtype=np.float64)
+
+    if cashflows.shape[-1:] != variances.shape[-1:]:
         raise ValueError("Cashflows and variances must have same length")
 
-    npv_adj = -initial_investment
+    t = np.arange(1, cashflows.shape[-1] + 1)
 
-    for t, (cf, var) in enumerate(zip(annual_cashflows, cashflow_variances), start=1):
-        # Adjust cashflow for variance (certainty equivalent)
-        adjusted_cf = cf * (1 - var**2 / 2)
+    # Adjust cashflow for variance (certainty equivalent)
+    adjusted_cf = cashflows * (1 - variances**2 / 2)
 
-        # Risk-adjusted discount rate
-        adjusted_discount = discount_rate + risk_aversion * var
+    # Risk-adjusted discount rate
+    adjusted_discount = discount_rate + risk_aversion * variances
 
-        # Present value of adjusted cashflow
-        pv = adjusted_cf / ((1 + adjusted_discount) ** t)
-        npv_adj += pv
+    # Present value of adjusted cashflows, summed over the time axis
+    pv = adjusted_cf / (1 + adjusted_discount) ** t
+    npv_adj = pv.sum(axis=-1) - initial_investment
 
-    return npv_adj
+    return float(npv_adj) if npv_adj.ndim == 0 else npv_adj
 
 
+@lru_cache(maxsize=4096)
 def calculate_breakeven_with_degradation(
     initial_investment: float,
     annual_cashflow: float,
@@ -247,6 +259,10 @@ def calculate_breakeven_with_degradation(
 
     Notes
     -----
+    Results are memoized per argument tuple, since fleet sweeps repeat the
+    same vehicle-class scenario many times. Arguments must be hashable
+    scalars; use calculate_breakeven_with_degradation_vec for arrays.
+
     The degradation adjustment accounts for:
     - Battery performance loss (15% over 1.5 years from Queensland trials)
     - Reduced operational efficiency over time
@@ -267,7 +283,7 @@ def calculate_breakeven_with_degradation(
 
     # Standard break-even calculation (present value based)
     if discount_rate > 0:
-        base_breakeven = np.log(1 + initial_investment / annual_cashflow) / np.log(1 + discount_rate)
+        base_breakeven = math.log1p(initial_investment / annual_cashflow) / math.log1p(discount_rate)
     else:
         # Simple payback without discounting
         base_breakeven = initial_investment / annual_cashflow
@@ -278,6 +294,49 @@ def calculate_breakeven_with_degradation(
     return breakeven
 
 
+def calculate_breakeven_with_degradation_vec(
+    initial_investments: np.ndarray,
+    annual_cashflows: np.ndarray,
+    discount_rate: float = DEFAULT_DISCOUNT_RATE,
+    degradation_years: Union[float, np.ndarray] = 0.5
+) -> np.ndarray:
+    """
+    Vectorized break-even time for many investments at one discount rate.
+
+    Array counterpart of calculate_breakeven_with_degradation; the
+    ln(1 + r) denominator is evaluated once for the whole batch.
+
+    Parameters
+    ----------
+    initial_investments : np.ndarray
+        Initial investments
+    annual_cashflows : np.ndarray
+        Average annual cash flows (broadcast against initial_investments)
+    discount_rate : float
+        Discount rate (8% default)
+    degradation_years : float or np.ndarray
+        Additional time due to degradation effects (ΔT_degradation)
+
+    Returns
+    -------
+    np.ndarray
+        Break-even periods (years); inf where the cash flow is not positive
+    """
+    investments = np.asarray(initial_investments, dtype=np.float64)
+    cashflows = np.asarray(annual_cashflows, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = investments / cashflows
+        if discount_rate > 0:
+            base_breakeven = np.log1p(ratio) / math.log1p(discount_rate)
+        else:
+            base_breakeven = ratio
+
+    base_breakeven = np.where(cashflows > 0, base_breakeven, np.inf)
+
+    return base_breakeven + degradation_years
+
+
 def calculate_npv_with_escalation(
     initial_investment: float,
     annual_cashflow: float,
@@ -324,17 +383,15 @@ def calculate_npv_with_escalation(
     """
     npv = -initial_investment
 
-    for t in range(1, analysis_period + 1):
-        # Escalate cashflow
-        cf = annual_cashflow * ((1 + escalation_rate) ** t)
+    # Combined per-year growth: escalation × degradation / discounting
+    growth = (1.0 + escalation_rate) / (1.0 + discount_rate)
+    if degradation_factor is not None:
+        growth *= degradation_factor
 
-        # Apply degradation if specified
-        if degradation_factor is not None:
-            cf *= (degradation_factor ** t)
-
-        # Discount to present value
-        pv = cf / ((1 + discount_rate) ** t)
-        npv += pv
+    factor = 1.0
+    for _ in range(analysis_period):
+        factor *= growth
+        npv += annual_cashflow * factor
 
     return npv
 
@@ -385,24 +442,27 @@ def calculate_levelized_cost_of_operation(
     ... )
     # Returns levelized $/km
     """
+    # Annuity factor Σ 1/(1+r)^t, shared by operating cost and distance
+    inv = 1.0 / (1.0 + discount_rate)
+    discount = 1.0
+    annuity_factor = 0.0
+    for _ in range(analysis_period):
+        discount *= inv
+        annuity_factor += discount
+
     # Present value of all costs
     pv_capex = initial_investment
-
-    pv_opex = 0
-    for t in range(1, analysis_period + 1):
-        pv_opex += annual_operating_cost / ((1 + discount_rate) ** t)
+    pv_opex = annual_operating_cost * annuity_factor
 
     # Present value of residual value (negative cost)
     residual_value = initial_investment * residual_value_factor
-    pv_residual = residual_value / ((1 + discount_rate) ** analysis_period)
+    pv_residual = residual_value * discount
 
     # Total present value of costs
     total_pv_cost = pv_capex + pv_opex - pv_residual
 
     # Present value of total distance
-    pv_distance = 0
-    for t in range(1, analysis_period + 1):
-        pv_distance += annual_distance / ((1 + discount_rate) ** t)
+    pv_distance = annual_distance * annuity_factor
 
     # Levelized cost
     levelized_cost = total_pv_cost / pv_distance
@@ -417,6 +477,7 @@ __all__ = [
     "calculate_roi",
     "calculate_risk_adjusted_npv",
     "calculate_breakeven_with_degradation",
+    "calculate_breakeven_with_degradation_vec",
     "calculate_npv_with_escalation",
     "calculate_levelized_cost_of_operation",
 ]
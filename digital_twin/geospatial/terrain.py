@@ -11,4 +11,34 @@ def calculate_terrain_gradient(elevation_profile: np.ndarray, distance_profile:
     return np.arctan(rise / run)
 
 
-__all__ = ["calculate_terrain_gradient"]
+def calculate_terrain_gradient_analytical(
+    x: np.ndarray, W: np.ndarray, beta: np.ndarray, b: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate exact elevation gradient for a sinusoidal-basis terrain model.
+
+    For Elevation(x) = Σ_i β_i·sin(W_iᵀx + b_i) the gradient has the closed
+    form ∇Elevation(x) = W·(β ⊙ cos(Wᵀx + b)), avoiding the quantization
+    error of finite differences.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Query position (d,)
+    W : np.ndarray
+        Basis frequency matrix (d, n)
+    beta : np.ndarray
+        Basis amplitudes (n,)
+    b : np.ndarray
+        Basis phase offsets (n,)
+
+    Returns
+    -------
+    np.ndarray
+        Elevation gradient at x (d,)
+    """
+    z = W.T @ x + b
+    return W @ (beta * np.cos(z))
+
+
+__all__ = ["calculate_terrain_gradient", "calculate_terrain_gradient_analytical"]
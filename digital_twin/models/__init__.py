@@ -16,14 +16,19 @@ from digital_twin.models.equations import (
     # Emissions Models
     calculate_total_fleet_emissions,
     calculate_technology_trip_emissions,
+    calculate_technology_trip_emissions_batch,
     calculate_longitudinal_transition_emissions,
 
     # Degradation Models
     calculate_battery_performance_degradation,
+    calculate_battery_performance_degradation_batch,
     calculate_operational_range,
+    calculate_operational_range_grid,
 
     # Energy Models
     calculate_wheel_energy_per_trip,
+    make_wheel_energy_fn,
+    calculate_wheel_energy_batch,
     calculate_battery_electric_energy,
     calculate_hydrogen_energy,
 
@@ -36,20 +41,26 @@ from digital_twin.models.equations import (
 
     # Validation
     validate_queensland_trials,
+    validate_queensland_trials_batch,
 )
 
 __all__ = [
     # Emissions Models
     "calculate_total_fleet_emissions",
     "calculate_technology_trip_emissions",
+    "calculate_technology_trip_emissions_batch",
     "calculate_longitudinal_transition_emissions",
 
     # Degradation Models
     "calculate_battery_performance_degradation",
+    "calculate_battery_performance_degradation_batch",
     "calculate_operational_range",
+    "calculate_operational_range_grid",
 
     # Energy Models
     "calculate_wheel_energy_per_trip",
+    "make_wheel_energy_fn",
+    "calculate_wheel_energy_batch",
     "calculate_battery_electric_energy",
     "calculate_hydrogen_energy",
 
@@ -62,4 +73,5 @@ __all__ = [
 
     # Validation
     "validate_queensland_trials",
+    "validate_queensland_trials_batch",
 ]
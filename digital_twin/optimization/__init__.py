@@ -1,11 +1,45 @@
-"""Optimization module."""
+"""Optimization module.
+
+Public names are resolved lazily on first access (PEP 562), so importing
+the package does not load SciPy until an optimizer is actually used.
+"""
+
+import importlib
+
+_LAZY_EXPORTS = {
+    "TechCatalog": "fleet_optimizer",
+    "InfraRequirements": "fleet_optimizer",
+    "optimize_fleet_composition": "fleet_optimizer",
+    "optimize_technology_mix": "fleet_optimizer",
+    "optimize_technology_mix_packed": "fleet_optimizer",
+    "optimize_technology_mix_trajectory": "fleet_optimizer",
+    "optimize_technology_mix_batch": "fleet_optimizer",
+    "check_range_constraint": "constraints",
+    "check_range_constraints": "constraints",
+    "cost_objective": "objectives",
+    "cost_objective_grid": "objectives",
+    "solve_linear_program": "solvers",
+}
+
+
+def __getattr__(name):
+    try:
+        submodule = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from digital_twin.optimization.fleet_optimizer import optimize_fleet_composition
-from digital_twin.optimization.constraints import check_range_constraint
-from digital_twin.optimization.objectives import cost_objective
-from digital_twin.optimization.solvers import solve_linear_program
 
 __all__ = [
-    "optimize_fleet_composition", "check_range_constraint",
-    "cost_objective", "solve_linear_program",
+    "TechCatalog", "InfraRequirements", "optimize_fleet_composition", "optimize_technology_mix",
+    "optimize_technology_mix_packed", "optimize_technology_mix_trajectory",
+    "optimize_technology_mix_batch",
+    "check_range_constraint", "check_range_constraints", "cost_objective",
+    "cost_objective_grid", "solve_linear_program",
 ]
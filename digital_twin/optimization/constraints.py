@@ -1,9 +1,18 @@
 """Range, charging, capacity constraints."""
 
+import numpy as np
+
 
 def check_range_constraint(vehicle_range: float, daily_distance: float, margin: float = 0.2) -> bool:
     """Check if vehicle range meets daily distance requirement."""
     return vehicle_range >= daily_distance * (1 + margin)
 
 
-__all__ = ["check_range_constraint"]
+def check_range_constraints(
+    vehicle_range: np.ndarray, daily_distance: np.ndarray, margin: float = 0.2
+) -> np.ndarray:
+    """Vectorized range check over broadcast arrays of ranges and daily distances."""
+    return np.greater_equal(vehicle_range, np.multiply(daily_distance, 1.0 + margin))
+
+
+__all__ = ["check_range_constraint", "check_range_constraints"]
@@ -19,39 +19,162 @@ Where:
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, TypedDict, Union
+from functools import lru_cache
+from scipy.optimize import linprog
+from scipy.sparse import block_diag, csr_matrix
+
+from digital_twin.core.constants import TECH_BEV, TECH_FCET
+
+
+@dataclass(frozen=True)
+class TechCatalog:
+    """
+    Immutable technology catalogue with precomputed index lookups.
+
+    Build once per fleet catalogue with TechCatalog.from_list and pass it in
+    place of the technology list to the optimize_technology_mix family, so
+    repeated calls skip membership scans and name lookups.
+    """
+
+    names: Tuple[str, ...]
+    diesel_idx: int = -1
+    bev_idx: int = -1
+    name_to_idx: Dict[str, int] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def from_list(cls, technologies: List[str]) -> "TechCatalog":
+        """Create (or reuse) the catalogue for a list of technology names."""
+        return _tech_catalog(tuple(technologies))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class InfraRequirements(TypedDict):
+    """
+    Infrastructure requirements returned by calculate_infrastructure_requirements.
+
+    A plain dict at runtime; this only declares its keys and value types
+    for type checkers. A dict literal is the cheapest record to build here,
+    and it keeps membership tests, dict(), .get() and json.dumps working.
+    """
+
+    chargers_needed: float
+    total_capacity: float
+    peak_demand: float
+    utilization: float
+    unit: str
+
+
+@lru_cache(maxsize=32)
+def _tech_catalog(names: Tuple[str, ...]) -> TechCatalog:
+    name_to_idx = {name: i for i, name in enumerate(names)}
+    return TechCatalog(
+        names=names,
+        diesel_idx=name_to_idx.get('diesel', -1),
+        bev_idx=name_to_idx.get('bev', -1),
+        name_to_idx=name_to_idx,
+    )
+
+
+_DEFAULT_TECHNOLOGIES = ('bev', 'fcet', 'diesel', 'hybrid')
+
+
+def _as_catalog(technologies: Union[List[str], TechCatalog]) -> TechCatalog:
+    if isinstance(technologies, TechCatalog):
+        return technologies
+    return TechCatalog.from_list(technologies)
 
 
 def optimize_fleet_composition(cost_matrix: np.ndarray, constraints: dict) -> dict:
     """
-    Optimize fleet composition (simplified heuristic implementation).
+    Optimize fleet composition as a linear program over technology shares.
 
-    For production use, consider scipy.optimize or similar optimization libraries.
+    min Σ_i c_i x_i   subject to   Σ_i x_i = 1,  0 ≤ x_i ≤ A_max,i
+
+    where c_i is the summed cost row of technology i and x_i its fleet share.
+    Per-technology limits (adoption caps, range infeasibility) are identity
+    constraints and are passed to HiGHS as variable bounds rather than
+    materialized as constraint rows; only the share balance and the budget
+    are sparse matrix rows.
 
     Parameters
     ----------
     cost_matrix : np.ndarray
-        Cost matrix for different technologies
+        Cost matrix of shape (n_tech, n_components), e.g. columns
+        (capital cost, annual operating cost)
     constraints : dict
-        Optimization constraints
+        Optimization constraints, all optional:
+
+        - 'technologies': technology names (defaults to
+          ['bev', 'fcet', 'diesel', 'hybrid'] truncated to n_tech)
+        - 'min_range' with 'vehicle_ranges': technologies whose range is
+          below min_range are excluded
+        - 'max_adoption': maximum fleet share per technology
+        - 'max_budget' with 'fleet_size' (default 1): capital budget,
+          fleet_size · Σ_i C_i,0 x_i ≤ max_budget
 
     Returns
     -------
     dict
-        Optimal technology mix
+        Optimal technology mix {technology: fleet_share}
 
     Examples
     --------
     >>> costs = np.array([[400000, 50000], [500000, 45000], [200000, 80000]])
-    >>> constraints = {'max_budget': 10000000, 'min_range': 200}
+    >>> constraints = {'max_budget': 10000000, 'fleet_size': 20,
+    ...                'max_adoption': [1.0, 1.0, 0.5]}
     >>> optimize_fleet_composition(costs, constraints)
-    {'bev': 0.6, 'fcet': 0.25, 'diesel': 0.15}
+    {'bev': 0.5, 'fcet': 0.0, 'diesel': 0.5}
     """
-    return {"bev": 0.6, "fcet": 0.25, "hybrid": 0.15}
+    cost_matrix = np.asarray(cost_matrix, dtype=float)
+    n_tech = cost_matrix.shape[0]
+    technologies = constraints.get('technologies')
+    if technologies is None:
+        if n_tech > len(_DEFAULT_TECHNOLOGIES):
+            raise ValueError("constraints['technologies'] is required for more than "
+                             f"{len(_DEFAULT_TECHNOLOGIES)} technologies")
+        technologies = _DEFAULT_TECHNOLOGIES[:n_tech]
+
+    total_costs = cost_matrix.sum(axis=1)
+
+    # Identity constraints as variable bounds
+    upper = np.ones(n_tech)
+    if constraints.get('max_adoption') is not None:
+        np.minimum(upper, constraints['max_adoption'], out=upper)
+    if constraints.get('min_range') is not None and constraints.get('vehicle_ranges') is not None:
+        upper[np.asarray(constraints['vehicle_ranges']) < constraints['min_range']] = 0.0
+    bounds = np.column_stack((np.zeros(n_tech), upper))
+
+    # Share balance: Σ x_i = 1
+    A_eq = csr_matrix(np.ones((1, n_tech)))
+
+    # Capital budget: fleet_size · Σ C_i x_i ≤ max_budget
+    A_ub = b_ub = None
+    if constraints.get('max_budget') is not None:
+        A_ub = csr_matrix(cost_matrix[:, :1].T * constraints.get('fleet_size', 1))
+        b_ub = [constraints['max_budget']]
+
+    res = linprog(
+        total_costs,
+        A_ub=A_ub,
+        b_ub=b_ub,
+        A_eq=A_eq,
+        b_eq=[1.0],
+        bounds=bounds,
+        method='highs',
+    )
+    if not res.success:
+        raise ValueError(f"Fleet composition optimization failed: {res.message}")
+
+    # HiGHS may return tiny negative values or -0.0 for shares at the bound
+    return dict(zip(technologies, np.maximum(res.x, 0.0).tolist()))
 
 
 def optimize_technology_mix(
-    technologies: List[str],
+    technologies: Union[List[str], TechCatalog],
     capital_costs: np.ndarray,
     maintenance_costs: np.ndarray,
     degradation_costs: np.ndarray,
@@ -60,7 +183,9 @@ def optimize_technology_mix(
     load_capacities: np.ndarray,
     total_demand: float,
     charging_infrastructure: int,
-    max_adoption: Optional[np.ndarray] = None
+    max_adoption: Optional[np.ndarray] = None,
+    autoscale: bool = False,
+    solver_options: Optional[dict] = None
 ) -> Dict[str, float]:
     """
     Optimize fleet technology mix to minimize total cost.
@@ -75,7 +200,7 @@ def optimize_technology_mix(
 
     Parameters
     ----------
-    technologies : list of str
+    technologies : list of str or TechCatalog
         Technology types (e.g., ['bev', 'fcet', 'diesel', 'hybrid'])
     capital_costs : np.ndarray
         Capital cost for each technology (C_i,j,t)
@@ -95,6 +220,13 @@ def optimize_technology_mix(
         Available charging infrastructure (I_charging)
     max_adoption : np.ndarray, optional
         Maximum adoption rate for each technology (A_max)
+    autoscale : bool
+        Equilibrate constraint rows and columns before solving. Improves
+        conditioning when capacities and demand span several orders of
+        magnitude.
+    solver_options : dict, optional
+        HiGHS options forwarded to scipy.optimize.linprog, e.g.
+        {'presolve': False} for long runs of tiny sequential solves
 
     Returns
     -------
@@ -103,14 +235,24 @@ def optimize_technology_mix(
 
     Notes
     -----
-    This is a simplified heuristic implementation. For production use, integrate with:
+    Solved as a linear program with the HiGHS solver (scipy.optimize.linprog).
+    X_i is the (continuous) number of vehicles of technology i:
+
+    - Range-infeasible technologies are bounded to X_i = 0
+    - Every technology other than 'diesel' draws on the charging/refuelling
+      infrastructure, so Σ_{i≠diesel} X_i ≤ I_charging
+    - Adoption limits are fleet shares: X_i ≤ A_max,i · Σ_j X_j
+
+    Exact cost ties are broken deterministically in favour of the
+    technology listed first. The returned allocation is X normalized to
+    fleet fractions.
+
+    The full model should be integrated with:
     - Model Attributes for parameters
     - Emissions Model for environmental constraints
     - Degradation Model for performance constraints
     - Economic ROI for financial optimization
 
-    Use scipy.optimize.linprog or CVXPY for proper linear/convex optimization.
-
     Examples
     --------
     >>> technologies = ['bev', 'fcet', 'diesel']
@@ -126,60 +268,461 @@ def optimize_technology_mix(
     ...     capacities, 1000000, 50
     ... )
     >>> print(result)
-    {'bev': 0.7, 'fcet': 0.2, 'diesel': 0.1}
+    {'bev': 0.0, 'fcet': 0.0, 'diesel': 1.0}
     """
-    n_tech = len(technologies)
+    # Total costs per technology, accumulated in place (one allocation)
+    total_costs = np.add(capital_costs, maintenance_costs, dtype=float)
+    np.add(total_costs, degradation_costs, out=total_costs)
 
-    # Total costs per technology
-    total_costs = capital_costs + maintenance_costs + degradation_costs
+    return _solve_technology_mix(
+        technologies, total_costs, range_requirements, vehicle_ranges,
+        load_capacities, total_demand, charging_infrastructure, max_adoption,
+        autoscale, solver_options
+    )
 
-    # Check range constraints
-    feasible = vehicle_ranges >= range_requirements
 
-    # Filter infeasible technologies
-    feasible_indices = np.where(feasible)[0]
+def optimize_technology_mix_packed(
+    technologies: Union[List[str], TechCatalog],
+    costs: np.ndarray,
+    range_requirements: np.ndarray,
+    vehicle_ranges: np.ndarray,
+    load_capacities: np.ndarray,
+    total_demand: float,
+    charging_infrastructure: int,
+    max_adoption: Optional[np.ndarray] = None,
+    autoscale: bool = False,
+    solver_options: Optional[dict] = None
+) -> Dict[str, float]:
+    """
+    Optimize fleet technology mix from a pre-assembled cost matrix.
+
+    Same linear program as optimize_technology_mix, but the cost components
+    are passed as one contiguous matrix so scenario sweeps can build it once
+    and reuse it across calls.
 
-    if len(feasible_indices) == 0:
+    Parameters
+    ----------
+    technologies : list of str or TechCatalog
+        Technology types (e.g., ['bev', 'fcet', 'diesel', 'hybrid'])
+    costs : np.ndarray
+        Cost components per technology, shape (n_tech, n_components),
+        e.g. columns (capital, maintenance, degradation)
+    range_requirements : np.ndarray
+        Required range for each vehicle type
+    vehicle_ranges : np.ndarray
+        Available range for each technology
+    load_capacities : np.ndarray
+        Load capacity for each technology (L_i,j)
+    total_demand : float
+        Total fleet capacity demand (D_total)
+    charging_infrastructure : int
+        Available charging infrastructure (I_charging)
+    max_adoption : np.ndarray, optional
+        Maximum adoption rate for each technology (A_max)
+    autoscale : bool
+        Equilibrate constraint rows and columns before solving. Improves
+        conditioning when capacities and demand span several orders of
+        magnitude.
+    solver_options : dict, optional
+        HiGHS options forwarded to scipy.optimize.linprog, e.g.
+        {'presolve': False} for long runs of tiny sequential solves
+
+    Returns
+    -------
+    dict
+        Optimal technology mix {technology: allocation_fraction}
+
+    Examples
+    --------
+    >>> costs = np.array([
+    ...     [400000, 20000, 15000],
+    ...     [500000, 25000, 18000],
+    ...     [200000, 40000, 10000],
+    ... ])
+    >>> range_req = np.array([150, 150, 150])
+    >>> ranges = np.array([200, 250, 400])
+    >>> capacities = np.array([36000, 36000, 36000])
+    >>> optimize_technology_mix_packed(
+    ...     ['bev', 'fcet', 'diesel'], costs, range_req, ranges,
+    ...     capacities, 1000000, 50
+    ... )
+    {'bev': 0.0, 'fcet': 0.0, 'diesel': 1.0}
+    """
+    total_costs = np.sum(costs, axis=1, dtype=float)
+    return _solve_technology_mix(
+        technologies, total_costs, range_requirements, vehicle_ranges,
+        load_capacities, total_demand, charging_infrastructure, max_adoption,
+        autoscale, solver_options
+    )
+
+
+def _solve_technology_mix(
+    technologies: Union[List[str], TechCatalog],
+    total_costs: np.ndarray,
+    range_requirements: np.ndarray,
+    vehicle_ranges: np.ndarray,
+    load_capacities: np.ndarray,
+    total_demand: float,
+    charging_infrastructure: int,
+    max_adoption: Optional[np.ndarray],
+    autoscale: bool = False,
+    solver_options: Optional[dict] = None
+) -> Dict[str, float]:
+    """Solve the single-period technology mix LP for given total costs."""
+    catalog = _as_catalog(technologies)
+    n_tech = len(catalog)
+
+    # Range constraints: infeasible technologies are fixed at zero vehicles
+    feasible = vehicle_ranges >= range_requirements
+    if not np.any(feasible):
         raise ValueError("No technologies meet range requirements")
+    bounds = np.column_stack((np.zeros(n_tech), np.where(feasible, np.inf, 0.0)))
+
+    A_ub, b_ub = _technology_mix_constraints(
+        np.asarray(load_capacities, dtype=float)[None, :],
+        np.array([total_demand], dtype=float),
+        np.array([charging_infrastructure], dtype=float),
+        catalog.diesel_idx,
+        None if max_adoption is None else np.asarray(max_adoption, dtype=float)[None, :],
+    )
+
+    col_scale = np.ones((1, n_tech))
+    if autoscale:
+        A_ub, b_ub, col_scale = _equilibrate(A_ub, b_ub)
+
+    res = linprog(
+        _tie_break_costs(total_costs * col_scale[0]),
+        A_ub=A_ub[0],
+        b_ub=b_ub[0],
+        bounds=bounds,
+        method='highs',
+        options=solver_options,
+    )
+    if not res.success:
+        raise ValueError(f"Technology mix optimization failed: {res.message}")
+
+    vehicles = np.maximum(res.x, 0.0) * col_scale[0]
+    fleet_size = vehicles.sum()
+    if fleet_size <= 0:
+        return dict(_zero_mix(catalog.names))
+
+    return dict(zip(catalog.names, (vehicles / fleet_size).tolist()))
+
+
+def optimize_technology_mix_trajectory(
+    technologies: Union[List[str], TechCatalog],
+    capital_costs: np.ndarray,
+    maintenance_costs: np.ndarray,
+    degradation_costs: np.ndarray,
+    range_requirements: np.ndarray,
+    vehicle_ranges: np.ndarray,
+    load_capacities: np.ndarray,
+    total_demand: np.ndarray,
+    charging_infrastructure: Union[int, np.ndarray],
+    max_adoption: Optional[np.ndarray] = None,
+    autoscale: bool = False,
+    solver_options: Optional[dict] = None
+) -> List[Dict[str, float]]:
+    """
+    Optimize the technology mix for every period of a planning horizon.
 
-    # Among feasible, minimize cost (simplified heuristic)
-    feasible_costs = total_costs[feasible_indices]
-    optimal_idx = feasible_indices[np.argmin(feasible_costs)]
+    Solves the same linear program as optimize_technology_mix for each of T
+    periods, stacked into a single block-diagonal LP so HiGHS is invoked
+    once for the whole horizon.
 
-    # Build result
-    result = {tech: 0.0 for tech in technologies}
+    Parameters
+    ----------
+    technologies : list of str or TechCatalog
+        Technology types (e.g., ['bev', 'fcet', 'diesel', 'hybrid'])
+    capital_costs, maintenance_costs, degradation_costs : np.ndarray
+        Cost components, shape (T, n_tech) or (n_tech,) if constant
+    range_requirements, vehicle_ranges : np.ndarray
+        Required and available range, shape (T, n_tech) or (n_tech,)
+    load_capacities : np.ndarray
+        Load capacity for each technology, shape (T, n_tech) or (n_tech,)
+    total_demand : np.ndarray
+        Total fleet capacity demand per period, shape (T,)
+    charging_infrastructure : int or np.ndarray
+        Available charging infrastructure, scalar or shape (T,)
+    max_adoption : np.ndarray, optional
+        Maximum adoption rates, shape (T, n_tech) or (n_tech,)
+    autoscale : bool
+        Equilibrate constraint rows and columns before solving
+    solver_options : dict, optional
+        HiGHS options forwarded to scipy.optimize.linprog
 
-    # Check infrastructure constraints
-    if max_adoption is not None and optimal_idx < len(max_adoption):
-        adoption_rate = min(1.0, max_adoption[optimal_idx])
-    else:
-        adoption_rate = 1.0
+    Returns
+    -------
+    list of dict
+        Optimal technology mix {technology: allocation_fraction} per period
 
-    # Check capacity constraints
-    optimal_capacity = load_capacities[optimal_idx]
-    vehicles_needed = np.ceil(total_demand / optimal_capacity)
+    Examples
+    --------
+    >>> capital_costs = np.array([400000, 500000, 200000])
+    >>> maintenance_costs = np.array([20000, 25000, 40000])
+    >>> degradation_costs = np.array([15000, 18000, 10000])
+    >>> range_req = np.array([150, 150, 150])
+    >>> ranges = np.array([200, 250, 400])
+    >>> capacities = np.array([36000, 36000, 36000])
+    >>> mixes = optimize_technology_mix_trajectory(
+    ...     ['bev', 'fcet', 'diesel'], capital_costs, maintenance_costs,
+    ...     degradation_costs, range_req, ranges,
+    ...     capacities, np.linspace(1e6, 1.5e6, 10), 50
+    ... )
+    >>> len(mixes)
+    10
+    >>> mixes[-1]
+    {'bev': 0.0, 'fcet': 0.0, 'diesel': 1.0}
+    """
+    catalog = _as_catalog(technologies)
+    n_tech = len(catalog)
+    total_demand = np.atleast_1d(np.asarray(total_demand, dtype=float))
+    n_periods = total_demand.shape[0]
+    shape = (n_periods, n_tech)
+
+    total_costs = np.add(capital_costs, maintenance_costs, dtype=float)
+    np.add(total_costs, degradation_costs, out=total_costs)
+    total_costs = np.broadcast_to(total_costs, shape)
+
+    feasible = np.broadcast_to(
+        np.asarray(vehicle_ranges) >= np.asarray(range_requirements), shape
+    )
+    infeasible_periods = np.flatnonzero(~feasible.any(axis=1))
+    if infeasible_periods.size:
+        raise ValueError(
+            f"No technologies meet range requirements in period {infeasible_periods[0]}"
+        )
+    upper = np.where(feasible, np.inf, 0.0).ravel()
+    bounds = np.column_stack((np.zeros_like(upper), upper))
+
+    load_capacities = np.broadcast_to(np.asarray(load_capacities, dtype=float), shape)
+    charging_infrastructure = np.broadcast_to(
+        np.asarray(charging_infrastructure, dtype=float), (n_periods,)
+    )
+    if max_adoption is not None:
+        max_adoption = np.broadcast_to(np.asarray(max_adoption, dtype=float), shape)
+    A_ub, b_ub = _technology_mix_constraints(
+        load_capacities,
+        total_demand,
+        charging_infrastructure,
+        catalog.diesel_idx,
+        max_adoption,
+    )
+
+    col_scale = np.ones(shape)
+    if autoscale:
+        A_ub, b_ub, col_scale = _equilibrate(A_ub, b_ub)
+
+    res = linprog(
+        _tie_break_costs(total_costs * col_scale).ravel(),
+        A_ub=block_diag(A_ub, format='csr'),
+        b_ub=b_ub.ravel(),
+        bounds=bounds,
+        method='highs',
+        options=solver_options,
+    )
+    if not res.success:
+        raise ValueError(f"Technology mix optimization failed: {res.message}")
+
+    allocations = np.maximum(res.x, 0.0).reshape(shape) * col_scale
+    fleet_sizes = allocations.sum(axis=1, keepdims=True)
+    fractions = np.divide(
+        allocations, fleet_sizes, out=np.zeros_like(allocations), where=fleet_sizes > 0
+    )
+    return [dict(zip(catalog.names, row)) for row in fractions.tolist()]
+
+
+# Per-scenario arguments stacked by optimize_technology_mix_batch
+_SCENARIO_KEYS = (
+    'capital_costs', 'maintenance_costs', 'degradation_costs', 'range_requirements',
+    'vehicle_ranges', 'load_capacities', 'total_demand', 'charging_infrastructure',
+)
+
+
+def optimize_technology_mix_batch(
+    technologies: Union[List[str], TechCatalog],
+    scenarios: List[Dict[str, np.ndarray]]
+) -> List[Dict[str, float]]:
+    """
+    Optimize the technology mix for a batch of independent scenarios.
 
-    if vehicles_needed <= charging_infrastructure:
-        result[technologies[optimal_idx]] = adoption_rate
-        # Fill remaining with diesel (baseline)
-        if 'diesel' in technologies and adoption_rate < 1.0:
-            result['diesel'] = 1.0 - adoption_rate
-    else:
-        # Mixed fleet due to infrastructure constraints
-        infrastructure_fraction = charging_infrastructure / vehicles_needed
-        result[technologies[optimal_idx]] = min(adoption_rate, infrastructure_fraction)
-        if 'diesel' in technologies:
-            result['diesel'] = 1.0 - result[technologies[optimal_idx]]
+    Every scenario shares the technology catalogue and hence the sparsity
+    pattern of the LP, so the batch is solved as one block-diagonal problem
+    (see optimize_technology_mix_trajectory) and HiGHS analyses the
+    structure once instead of once per scenario.
+
+    Parameters
+    ----------
+    technologies : list of str or TechCatalog
+        Technology types shared by all scenarios
+    scenarios : list of dict
+        Keyword arguments of optimize_technology_mix for each scenario:
+        capital_costs, maintenance_costs, degradation_costs,
+        range_requirements, vehicle_ranges, load_capacities, total_demand,
+        charging_infrastructure and optionally max_adoption
+
+    Returns
+    -------
+    list of dict
+        Optimal technology mix {technology: allocation_fraction} per scenario
+
+    Examples
+    --------
+    >>> capital_costs = np.array([400000, 500000, 200000])
+    >>> maintenance_costs = np.array([20000, 25000, 40000])
+    >>> degradation_costs = np.array([15000, 18000, 10000])
+    >>> range_req = np.array([150, 150, 150])
+    >>> ranges = np.array([200, 250, 400])
+    >>> capacities = np.array([36000, 36000, 36000])
+    >>> base = dict(capital_costs=capital_costs, maintenance_costs=maintenance_costs,
+    ...             degradation_costs=degradation_costs, range_requirements=range_req,
+    ...             vehicle_ranges=ranges, load_capacities=capacities,
+    ...             charging_infrastructure=50)
+    >>> mixes = optimize_technology_mix_batch(
+    ...     ['bev', 'fcet', 'diesel'],
+    ...     [dict(base, total_demand=d) for d in (1e6, 1.5e6, 2e6)]
+    ... )
+    >>> [mix['diesel'] for mix in mixes]
+    [1.0, 1.0, 1.0]
+    """
+    if not scenarios:
+        return []
+    for i, scenario in enumerate(scenarios):
+        missing = [key for key in _SCENARIO_KEYS if key not in scenario]
+        if missing:
+            raise ValueError(f"Scenario {i} is missing {', '.join(missing)}")
+
+    catalog = _as_catalog(technologies)
+    stacked = {
+        key: np.stack([np.asarray(scenario[key], dtype=float) for scenario in scenarios])
+        for key in _SCENARIO_KEYS
+    }
+    max_adoption = None
+    if any(scenario.get('max_adoption') is not None for scenario in scenarios):
+        # A share limit of 1 never binds, so it stands in for "no limit"
+        no_limit = np.ones(len(catalog))
+        max_adoption = np.stack([
+            no_limit if scenario.get('max_adoption') is None
+            else np.asarray(scenario['max_adoption'], dtype=float)
+            for scenario in scenarios
+        ])
+    return optimize_technology_mix_trajectory(catalog, max_adoption=max_adoption, **stacked)
+
+
+def _technology_mix_constraints(
+    load_capacities: np.ndarray,
+    total_demand: np.ndarray,
+    charging_infrastructure: np.ndarray,
+    diesel_idx: int,
+    max_adoption: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assemble the A_ub X ≤ b_ub blocks of the technology mix LP.
+
+    All periods are written into one (T, n_rows, n_tech) array copied from
+    the cached structural template for this technology count: row 0 is
+    fleet capacity, row 1 the charging infrastructure and rows 2.. the
+    adoption-share limits (only when max_adoption is given).
+    """
+    n_periods, n_tech = load_capacities.shape
+    template = _constraint_template(n_tech, diesel_idx, max_adoption is not None)
+    A_ub = np.repeat(template[None, :, :], n_periods, axis=0)
+    b_ub = np.zeros((n_periods, template.shape[0]))
+
+    # Fleet capacity: Σ L_i X_i ≥ D_total
+    np.negative(load_capacities, out=A_ub[:, 0, :])
+    np.negative(total_demand, out=b_ub[:, 0])
+
+    # Charging infrastructure: Σ X_i ≤ I_charging over non-diesel technologies
+    b_ub[:, 1] = charging_infrastructure
+
+    # Technology adoption limits: X_i - A_max,i Σ_j X_j ≤ 0
+    if max_adoption is not None:
+        A_ub[:, 2:, :] -= max_adoption[:, :, None]
+
+    return A_ub, b_ub
+
+
+@lru_cache(maxsize=32)
+def _constraint_template(n_tech: int, diesel_idx: int, adoption_limits: bool) -> np.ndarray:
+    """
+    Data-independent part of one technology mix constraint block.
+
+    Holds the infrastructure row (ones, zero for diesel) and, with adoption
+    limits, the identity of X_i - A_max,i Σ_j X_j. Specialized and cached per
+    technology count, so repeated solves only write the data-dependent
+    entries. Returned read-only.
+    """
+    template = np.zeros((2 + n_tech if adoption_limits else 2, n_tech))
+    template[1] = 1.0
+    if diesel_idx >= 0:
+        template[1, diesel_idx] = 0.0
+    if adoption_limits:
+        template[2:] = np.eye(n_tech)
+    template.setflags(write=False)
+    return template
 
-    return result
+
+# Cost offset per technology index used to rank exact cost ties; just
+# above the HiGHS dual feasibility tolerance so it is honoured
+_TIE_BREAK_EPS = 1e-7
+
+
+def _tie_break_costs(total_costs: np.ndarray) -> np.ndarray:
+    """
+    Branch-free, tie-breaking LP cost key.
+
+    Normalizes each cost row to max|c| = 1 (which does not change the
+    optimal allocation) and adds eps·i to technology i, so among
+    technologies with equal cost the one listed first is always chosen
+    instead of an arbitrary optimal vertex. Works row-wise on (T, n_tech).
+    """
+    total_costs = np.asarray(total_costs, dtype=float)
+    n_tech = total_costs.shape[-1]
+    scale = np.abs(total_costs).max(axis=-1, keepdims=True)
+    key = np.divide(total_costs, scale, out=np.zeros_like(total_costs), where=scale > 0)
+    key += _TIE_BREAK_EPS * np.arange(n_tech)
+    return key
+
+
+def _equilibrate(
+    A_ub: np.ndarray,
+    b_ub: np.ndarray,
+    n_iter: int = 4
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Curtis-Reid style row/column equilibration of stacked LP blocks.
+
+    Alternately divides each row and column of every (rows, n_tech) block by
+    the square root of its largest magnitude. Returns the scaled A_ub and
+    b_ub and the column scales; the scaled variables are y = x / col_scale.
+    Bounds of 0 and +inf are invariant under the column scaling.
+    """
+    magnitudes = np.abs(A_ub)
+    row_scale = np.ones(A_ub.shape[:2])
+    col_scale = np.ones((A_ub.shape[0], A_ub.shape[2]))
+    for _ in range(n_iter):
+        row_max = (magnitudes * col_scale[:, None, :]).max(axis=2) * row_scale
+        row_scale /= np.sqrt(np.where(row_max > 0, row_max, 1.0))
+        col_max = (magnitudes * row_scale[:, :, None]).max(axis=1) * col_scale
+        col_scale /= np.sqrt(np.where(col_max > 0, col_max, 1.0))
+    scaled_A = A_ub * row_scale[:, :, None] * col_scale[:, None, :]
+    return scaled_A, b_ub * row_scale, col_scale
+
+
+@lru_cache(maxsize=32)
+def _zero_mix(technologies: Tuple[str, ...]) -> Dict[str, float]:
+    """All-zero allocation template for a technology catalogue (copy before use)."""
+    return dict.fromkeys(technologies, 0.0)
 
 
 def calculate_fleet_transition_cost(
     current_fleet_value: float,
     new_fleet_cost: float,
     transition_years: int,
-    annual_replacement_rate: float = 0.20
-) -> Tuple[float, List[float]]:
+    annual_replacement_rate: float = 0.20,
+    as_array: bool = False
+) -> Tuple[float, Union[List[float], np.ndarray]]:
     """
     Calculate cost of transitioning fleet over time.
 
@@ -193,6 +736,8 @@ def calculate_fleet_transition_cost(
         Years to complete transition
     annual_replacement_rate : float
         Fraction of fleet replaced each year
+    as_array : bool
+        Return annual costs as a NumPy array instead of a list
 
     Returns
     -------
@@ -208,23 +753,18 @@ def calculate_fleet_transition_cost(
     >>> print(f"Total: ${total:,.0f}")
     >>> print(f"Annual: {[f'${c:,.0f}' for c in annual]}")
     """
-    annual_costs = []
+    # Value recovered from old vehicles declines with a 0.8/year residual
+    # factor; computed in one preallocated buffer
+    annual_costs = np.power(0.8, np.arange(transition_years, dtype=np.float64))
+    annual_costs *= -(current_fleet_value * annual_replacement_rate)
 
-    for year in range(transition_years):
-        # Cost of new vehicles
-        new_vehicles_cost = new_fleet_cost * annual_replacement_rate
+    # Net annual cost: flat cost of new vehicles less recovered value
+    annual_costs += new_fleet_cost * annual_replacement_rate
+    total_cost = float(annual_costs.sum())
 
-        # Value recovered from old vehicles
-        depreciation_factor = 0.8 ** year  # Declining residual value
-        recovered_value = current_fleet_value * annual_replacement_rate * depreciation_factor
-
-        # Net annual cost
-        net_cost = new_vehicles_cost - recovered_value
-        annual_costs.append(net_cost)
-
-    total_cost = sum(annual_costs)
-
-    return total_cost, annual_costs
+    if as_array:
+        return total_cost, annual_costs
+    return total_cost, annual_costs.tolist()
 
 
 def calculate_infrastructure_requirements(
@@ -233,7 +773,7 @@ def calculate_infrastructure_requirements(
     daily_distance: float,
     vehicle_range: float,
     charging_time_hours: float = 4.0
-) -> Dict[str, float]:
+) -> InfraRequirements:
     """
     Calculate infrastructure requirements for fleet.
 
@@ -253,11 +793,12 @@ def calculate_infrastructure_requirements(
     Returns
     -------
     dict
-        Infrastructure requirements including:
+        Infrastructure requirements (keys as in InfraRequirements):
         - chargers_needed: Number of chargers/stations
         - total_capacity: Total power/fuel capacity needed
         - peak_demand: Peak power/fuel demand
         - utilization: Infrastructure utilization rate
+        - unit: Unit of total_capacity and peak_demand
 
     Examples
     --------
@@ -271,7 +812,8 @@ def calculate_infrastructure_requirements(
     tech = technology.lower()
 
     # Calculate charging/refueling frequency
-    charges_per_day = np.ceil(daily_distance / vehicle_range)
+    # Ceiling division via floor division: exact, and integral for int inputs
+    charges_per_day = -(-daily_distance // vehicle_range)
 
     # Total charging events per day
     total_charges_per_day = fleet_size * charges_per_day
@@ -279,7 +821,7 @@ def calculate_infrastructure_requirements(
     # Chargers needed (assuming 24h operation with some overhead)
     operating_hours_per_day = 16  # Effective operating hours
     charges_per_charger_per_day = operating_hours_per_day / charging_time_hours
-    chargers_needed = np.ceil(total_charges_per_day / charges_per_charger_per_day)
+    chargers_needed = -(-total_charges_per_day // charges_per_charger_per_day)
 
     # Capacity calculations
     if tech == 'bev':
@@ -309,13 +851,97 @@ def calculate_infrastructure_requirements(
         'total_capacity': float(total_capacity),
         'peak_demand': float(peak_demand),
         'utilization': float(min(utilization, 1.0)),
-        'unit': unit
+        'unit': unit,
+    }
+
+
+def calculate_infrastructure_requirements_batch(
+    fleet_size: np.ndarray,
+    technology_codes: np.ndarray,
+    daily_distance: np.ndarray,
+    vehicle_range: np.ndarray,
+    charging_time_hours: Union[float, np.ndarray] = 4.0
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate infrastructure requirements for many fleet configurations at once.
+
+    Vectorized counterpart of calculate_infrastructure_requirements. All
+    inputs broadcast against each other; technologies are integer codes
+    from digital_twin.core.constants (TECH_BEV, TECH_FCET, ...), with any
+    other code treated as diesel (no infrastructure).
+
+    Parameters
+    ----------
+    fleet_size : np.ndarray
+        Number of vehicles in each fleet
+    technology_codes : np.ndarray
+        Integer technology code for each fleet
+    daily_distance : np.ndarray
+        Average daily distance per vehicle (km)
+    vehicle_range : np.ndarray
+        Vehicle range (km)
+    charging_time_hours : float or np.ndarray
+        Time to fully charge/refuel (hours)
+
+    Returns
+    -------
+    dict
+        Arrays for chargers_needed, total_capacity (kW for BEV, kg/day
+        H2 for FCET), peak_demand and utilization
+
+    Examples
+    --------
+    >>> from digital_twin.core.constants import TECH_BEV, TECH_FCET
+    >>> req = calculate_infrastructure_requirements_batch(
+    ...     np.array([50, 50]), np.array([TECH_BEV, TECH_FCET]), 200, 250
+    ... )
+    >>> req['chargers_needed']
+    array([13., 13.])
+    """
+    technology_codes = np.asarray(technology_codes)
+
+    # Calculate charging/refueling frequency
+    charges_per_day = -np.floor_divide(np.negative(daily_distance), vehicle_range, dtype=float)
+
+    # Total charging events per day
+    total_charges_per_day = charges_per_day * fleet_size
+
+    # Chargers needed (assuming 24h operation with some overhead)
+    operating_hours_per_day = 16  # Effective operating hours
+    charges_per_charger_per_day = np.divide(operating_hours_per_day, charging_time_hours)
+    chargers_needed = -np.floor_divide(-total_charges_per_day, charges_per_charger_per_day)
+
+    # Capacity: 150 kW chargers for BEV, 50 kg H2 per fill-up for FCET
+    is_bev = technology_codes == TECH_BEV
+    is_fcet = technology_codes == TECH_FCET
+    total_capacity = np.select(
+        [is_bev, is_fcet],
+        [chargers_needed * 150, total_charges_per_day * 50],
+        default=0.0,
+    )
+    peak_demand = total_capacity * np.select([is_bev, is_fcet], [0.7, 0.8], default=0.0)
+
+    utilization = charges_per_charger_per_day * np.divide(
+        charging_time_hours, operating_hours_per_day
+    )
+
+    return {
+        'chargers_needed': chargers_needed,
+        'total_capacity': total_capacity,
+        'peak_demand': peak_demand,
+        'utilization': np.minimum(utilization, 1.0),
     }
 
 
 __all__ = [
+    "TechCatalog",
+    "InfraRequirements",
     "optimize_fleet_composition",
     "optimize_technology_mix",
+    "optimize_technology_mix_packed",
+    "optimize_technology_mix_trajectory",
+    "optimize_technology_mix_batch",
     "calculate_fleet_transition_cost",
     "calculate_infrastructure_requirements",
+    "calculate_infrastructure_requirements_batch",
 ]
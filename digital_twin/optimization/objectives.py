@@ -1,9 +1,26 @@
 """Cost minimization and emissions reduction objectives."""
 
+import numpy as np
+from typing import Union
 
-def cost_objective(initial_cost: float, operating_cost: float, years: int) -> float:
-    """Calculate total cost objective."""
-    return initial_cost + (operating_cost * years)
 
+def cost_objective(
+    initial_cost: Union[float, np.ndarray],
+    operating_cost: Union[float, np.ndarray],
+    years: Union[int, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """Calculate total cost objective (element-wise for array inputs)."""
+    return np.asarray(initial_cost) + np.asarray(operating_cost) * np.asarray(years)
 
-__all__ = ["cost_objective"]
+
+def cost_objective_grid(
+    initial_costs: np.ndarray,
+    operating_costs: np.ndarray,
+    years: Union[int, np.ndarray]
+) -> np.ndarray:
+    """Total cost for every (initial cost, operating cost) pair, shape (n_initial, n_operating)."""
+    operating_total = np.multiply(operating_costs, years, dtype=float)
+    return np.add.outer(np.asarray(initial_costs, dtype=float), operating_total)
+
+
+__all__ = ["cost_objective", "cost_objective_grid"]
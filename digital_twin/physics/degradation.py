@@ -19,16 +19,73 @@ Queensland Trial Calibration:
 - ~300 km full charge capacity
 """
 
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
-from typing import Optional
+from typing import Optional, Union
 from digital_twin.core.constants import BATTERY_DEGRADATION_RATE, BATTERY_CYCLE_LIFE
 
+# Default per-cycle degradation rate and its log-retention, ln(1 - r)
+_DEFAULT_DEGRADATION_PER_CYCLE = 0.0001
+_DEFAULT_LOG1M_R = math.log1p(-_DEFAULT_DEGRADATION_PER_CYCLE)
+
+
+def _log_retention(degradation_per_cycle: float) -> float:
+    """Return ln(1 - r), reusing the precomputed value for the default r."""
+    if degradation_per_cycle == _DEFAULT_DEGRADATION_PER_CYCLE:
+        return _DEFAULT_LOG1M_R
+    return math.log1p(-degradation_per_cycle)
+
+
+def _cycle_factor(cycles, degradation_per_cycle: float):
+    """Return (1 - r)^cycles evaluated as exp(cycles·log1p(-r))."""
+    log_retention = _log_retention(degradation_per_cycle)
+    if np.ndim(cycles) == 0:
+        return math.exp(cycles * log_retention)
+    return np.exp(np.asarray(cycles, dtype=np.float64) * log_retention)
+
+
+@lru_cache(maxsize=4096)
+def _cached_calendar_factor(rate: float, years: float) -> float:
+    """
+    e^(-λt) for scalar inputs, memoized per (λ, t) pair.
+
+    math.exp is used directly: a truncated Taylor/Horner polynomial is
+    slower than a single libm call under CPython, and loses accuracy
+    (~3e-5 relative at λt = 0.5 for five terms).
+    """
+    return math.exp(-rate * years)
+
+
+def _calendar_factor(rate: float, years):
+    """Return e^(-λt), using the memoized scalar path when possible."""
+    if np.ndim(years) == 0:
+        return _cached_calendar_factor(float(rate), float(years))
+    return np.exp(-rate * np.asarray(years, dtype=np.float64))
+
+
+ArrayLike = Union[float, np.ndarray]
+
+
+def _as_float_array(x) -> ArrayLike:
+    """Convert array-like input to a float64 array; scalars become floats."""
+    if np.ndim(x) == 0:
+        return float(x)
+    return np.asarray(x, dtype=np.float64)
+
+
+def _unwrap(result: np.ndarray):
+    """Return a Python float for 0-d results, otherwise the array."""
+    return float(result) if np.ndim(result) == 0 else result
+
 
 def calculate_battery_degradation(
-    initial_capacity: float,
-    years: float,
+    initial_capacity: ArrayLike,
+    years: ArrayLike,
     degradation_rate: float = BATTERY_DEGRADATION_RATE
-) -> float:
+) -> ArrayLike:
     """
     Calculate battery capacity after degradation using exponential decay.
 
@@ -36,26 +93,27 @@ def calculate_battery_degradation(
 
     Parameters
     ----------
-    initial_capacity : float
+    initial_capacity : float or np.ndarray
         Initial battery capacity (kWh or range in km)
-    years : float
+    years : float or np.ndarray
         Number of years of operation
     degradation_rate : float
         Annual degradation rate (lambda)
 
     Returns
     -------
-    float
-        Degraded capacity
+    float or np.ndarray
+        Degraded capacity, broadcast over the array inputs
     """
-    capacity_degraded = initial_capacity * np.exp(-degradation_rate * years)
-    return capacity_degraded
+    initial_capacity = _as_float_array(initial_capacity)
+    capacity_degraded = initial_capacity * _calendar_factor(degradation_rate, years)
+    return _unwrap(capacity_degraded)
 
 
 def calculate_cycle_degradation(
     initial_capacity: float,
     cycles: int,
-    degradation_per_cycle: float = 0.0001
+    degradation_per_cycle: float = _DEFAULT_DEGRADATION_PER_CYCLE
 ) -> float:
     """
     Calculate battery degradation from charge cycles.
@@ -73,19 +131,24 @@ def calculate_cycle_degradation(
     -------
     float
         Degraded capacity
+
+    Notes
+    -----
+    (1 - r)^n is evaluated as exp(n·log1p(-r)), which is faster than a
+    general ``pow`` and keeps full precision for small r.
     """
-    # Compound degradation over cycles
-    capacity = initial_capacity * ((1 - degradation_per_cycle) ** cycles)
+    # Compound degradation over cycles, computed in log space
+    capacity = initial_capacity * _cycle_factor(cycles, degradation_per_cycle)
     return capacity
 
 
 def calculate_combined_degradation(
-    initial_capacity: float,
-    years: float,
-    cycles: int,
+    initial_capacity: ArrayLike,
+    years: ArrayLike,
+    cycles: ArrayLike,
     calendar_degradation_rate: float = BATTERY_DEGRADATION_RATE,
-    degradation_per_cycle: float = 0.0001
-) -> float:
+    degradation_per_cycle: float = _DEFAULT_DEGRADATION_PER_CYCLE
+) -> ArrayLike:
     """
     Calculate combined calendar and cycle degradation.
 
@@ -93,11 +156,11 @@ def calculate_combined_degradation(
 
     Parameters
     ----------
-    initial_capacity : float
+    initial_capacity : float or np.ndarray
         Initial battery capacity
-    years : float
+    years : float or np.ndarray
         Years of operation
-    cycles : int
+    cycles : int or np.ndarray
         Number of charge cycles
     calendar_degradation_rate : float
         Calendar aging rate
@@ -106,65 +169,77 @@ def calculate_combined_degradation(
 
     Returns
     -------
-    float
-        Degraded capacity
+    float or np.ndarray
+        Degraded capacity, broadcast over the array inputs
+
+    Notes
+    -----
+    For array inputs both aging terms share one exponential,
+    exp(-λt + n·ln(1 - r)), halving the transcendental work per element.
     """
+    initial_capacity = _as_float_array(initial_capacity)
+    cycles = _as_float_array(cycles)
+
+    if np.ndim(years) or np.ndim(cycles):
+        exponent = (
+            cycles * _log_retention(degradation_per_cycle)
+            - calendar_degradation_rate * np.asarray(years, dtype=np.float64)
+        )
+        return initial_capacity * np.exp(exponent)
+
     # Calendar aging
-    calendar_factor = np.exp(-calendar_degradation_rate * years)
+    calendar_factor = _calendar_factor(calendar_degradation_rate, years)
 
     # Cycle aging
-    cycle_factor = (1 - degradation_per_cycle) ** cycles
+    cycle_factor = _cycle_factor(cycles, degradation_per_cycle)
 
     # Combined
     capacity = initial_capacity * calendar_factor * cycle_factor
 
-    return capacity
+    return _unwrap(capacity)
 
 
 def estimate_remaining_life(
-    current_capacity: float,
-    initial_capacity: float,
+    current_capacity: ArrayLike,
+    initial_capacity: ArrayLike,
     end_of_life_threshold: float = 0.80
-) -> float:
+) -> ArrayLike:
     """
     Estimate remaining useful life of battery.
 
     Parameters
     ----------
-    current_capacity : float
+    current_capacity : float or np.ndarray
         Current battery capacity
-    initial_capacity : float
+    initial_capacity : float or np.ndarray
         Initial battery capacity
     end_of_life_threshold : float
         Capacity threshold for end of life (0.80 = 80%)
 
     Returns
     -------
-    float
-        Estimated years of remaining life
+    float or np.ndarray
+        Estimated years of remaining life (0 once past the threshold)
     """
-    current_soh = current_capacity / initial_capacity
-
-    if current_soh <= end_of_life_threshold:
-        return 0.0
+    current_soh = _as_float_array(current_capacity) / _as_float_array(initial_capacity)
 
-    # Estimate remaining degradation
-    remaining_degradation = current_soh - end_of_life_threshold
+    # Estimate remaining degradation; batteries past end of life have none
+    remaining_degradation = np.maximum(current_soh - end_of_life_threshold, 0.0)
 
     # Estimate years (assuming linear approximation)
     # This is simplified - real degradation is non-linear
     years_remaining = remaining_degradation / BATTERY_DEGRADATION_RATE
 
-    return years_remaining
+    return _unwrap(years_remaining)
 
 
 def calculate_operational_range(
-    rated_range: float,
-    battery_performance_factor: float,
-    temperature_factor: float = 1.0,
-    load_factor: float = 1.0,
-    gradient_factor: float = 1.0
-) -> float:
+    rated_range: ArrayLike,
+    battery_performance_factor: ArrayLike,
+    temperature_factor: ArrayLike = 1.0,
+    load_factor: ArrayLike = 1.0,
+    gradient_factor: ArrayLike = 1.0
+) -> ArrayLike:
     """
     Calculate effective operational range with environmental and operational factors.
 
@@ -189,8 +264,8 @@ def calculate_operational_range(
 
     Returns
     -------
-    float
-        Effective operational range (km)
+    float or np.ndarray
+        Effective operational range (km), broadcast over the array inputs
 
     Notes
     -----
@@ -208,13 +283,77 @@ def calculate_operational_range(
     156.06
     """
     effective_range = (
-        rated_range
-        * battery_performance_factor
+        _as_float_array(rated_range)
+        * _as_float_array(battery_performance_factor)
         * temperature_factor
         * load_factor
         * gradient_factor
     )
-    return max(0.0, effective_range)
+    return _unwrap(np.maximum(effective_range, 0.0))
+
+
+def calculate_effective_range_fused(
+    rated_range: ArrayLike,
+    years: ArrayLike,
+    cycles: ArrayLike,
+    calendar_degradation_rate: float = BATTERY_DEGRADATION_RATE,
+    degradation_per_cycle: float = _DEFAULT_DEGRADATION_PER_CYCLE,
+    temperature_factor: ArrayLike = 1.0,
+    load_factor: ArrayLike = 1.0,
+    gradient_factor: ArrayLike = 1.0
+) -> ArrayLike:
+    """
+    Calculate effective range from degradation state in a single pass.
+
+    Fused form of calculate_combined_degradation followed by
+    calculate_operational_range:
+
+    R = R_rated · e^(-λt + n·ln(1 - r_cycle)) · f_temp · f_load · f_gradient
+
+    Parameters
+    ----------
+    rated_range : float or np.ndarray
+        Manufacturer-rated range (km)
+    years : float or np.ndarray
+        Years of operation
+    cycles : float or np.ndarray
+        Number of charge cycles
+    calendar_degradation_rate : float
+        Calendar aging rate λ
+    degradation_per_cycle : float
+        Degradation per cycle
+    temperature_factor, load_factor, gradient_factor : float or np.ndarray
+        Environmental and operational correction factors (0-1)
+
+    Returns
+    -------
+    float or np.ndarray
+        Effective operational range (km), broadcast over the array inputs
+
+    Notes
+    -----
+    Calendar and cycle aging share one exponential, and no intermediate
+    capacity or factor arrays are materialized between the two models.
+
+    Examples
+    --------
+    >>> calculate_effective_range_fused(300.0, 1.5, 0)
+    255.89890769073946
+    """
+    exponent = (
+        _as_float_array(cycles) * _log_retention(degradation_per_cycle)
+        - calendar_degradation_rate * _as_float_array(years)
+    )
+    exp = math.exp if np.ndim(exponent) == 0 else np.exp
+
+    effective_range = (
+        _as_float_array(rated_range)
+        * exp(exponent)
+        * _as_float_array(temperature_factor)
+        * _as_float_array(load_factor)
+        * _as_float_array(gradient_factor)
+    )
+    return _unwrap(np.maximum(effective_range, 0.0))
 
 
 def calculate_degradation_rate_from_trials(
@@ -253,25 +392,25 @@ def calculate_degradation_rate_from_trials(
     # From P(t) = P_0 * e^(-λt)
     # λ = -ln(P(t)/P_0) / t
     capacity_ratio = final_capacity / initial_capacity
-    degradation_rate = -np.log(capacity_ratio) / years
+    degradation_rate = -math.log(capacity_ratio) / years
 
     return degradation_rate
 
 
 def estimate_end_of_life(
-    current_capacity: float,
-    initial_capacity: float,
+    current_capacity: ArrayLike,
+    initial_capacity: ArrayLike,
     degradation_rate: float = BATTERY_DEGRADATION_RATE,
     eol_threshold: float = 0.80
-) -> float:
+) -> ArrayLike:
     """
     Estimate time until battery reaches end-of-life threshold.
 
     Parameters
     ----------
-    current_capacity : float
+    current_capacity : float or np.ndarray
         Current battery capacity
-    initial_capacity : float
+    initial_capacity : float or np.ndarray
         Initial battery capacity
     degradation_rate : float
         Degradation rate λ (default from Queensland trials)
@@ -280,7 +419,7 @@ def estimate_end_of_life(
 
     Returns
     -------
-    float
+    float or np.ndarray
         Years until end-of-life
 
     Examples
@@ -289,31 +428,39 @@ def estimate_end_of_life(
     >>> estimate_end_of_life(270.0, 300.0, 0.106, 0.80)
     # Returns estimated years to 80% threshold
     """
-    current_soh = current_capacity / initial_capacity
+    current_soh = _as_float_array(current_capacity) / _as_float_array(initial_capacity)
 
-    if current_soh <= eol_threshold:
-        return 0.0
+    if np.ndim(current_soh) == 0:
+        # Scalar path: plain libm calls, no ufunc dispatch
+        if current_soh <= eol_threshold:
+            return 0.0
+        if degradation_rate <= 0:
+            return float('inf')
+        return max(0.0, math.log(current_soh / eol_threshold) / degradation_rate)
+
+    past_eol = current_soh <= eol_threshold
 
     # From P(t) = P_0 * e^(-λt)
     # t = -ln(P_threshold/P_current) / λ
     if degradation_rate <= 0:
-        return float('inf')
+        return _unwrap(np.where(past_eol, 0.0, np.inf))
 
-    time_to_eol = -np.log(eol_threshold / current_soh) / degradation_rate
+    with np.errstate(divide='ignore'):
+        time_to_eol = np.log(current_soh / eol_threshold) / degradation_rate
 
-    return max(0.0, time_to_eol)
+    return _unwrap(np.where(past_eol, 0.0, np.maximum(time_to_eol, 0.0)))
 
 
 def calculate_performance_with_environmental_factors(
-    base_performance: float,
-    ambient_temp_c: float,
-    load_kg: float,
-    max_load_kg: float,
-    route_elevation_gain_m: float,
-    route_distance_km: float,
+    base_performance: ArrayLike,
+    ambient_temp_c: ArrayLike,
+    load_kg: ArrayLike,
+    max_load_kg: ArrayLike,
+    route_elevation_gain_m: ArrayLike,
+    route_distance_km: ArrayLike,
     optimal_temp_c: float = 25.0,
     temp_sensitivity: float = 0.01
-) -> float:
+) -> ArrayLike:
     """
     Calculate adjusted performance accounting for environmental factors.
 
@@ -338,14 +485,17 @@ def calculate_performance_with_environmental_factors(
 
     Returns
     -------
-    float
-        Adjusted performance
+    float or np.ndarray
+        Adjusted performance, broadcast over array inputs
 
     Notes
     -----
     This function combines multiple operational factors to provide realistic
     performance estimates under various conditions.
 
+    Array inputs are clamped with np.maximum; the scalar path uses
+    conditional expressions instead of the ``max`` builtin.
+
     Examples
     --------
     >>> # Ideal conditions
@@ -354,26 +504,244 @@ def calculate_performance_with_environmental_factors(
     ... )
     # Returns adjusted range
     """
-    # Temperature factor
-    temp_deviation = abs(ambient_temp_c - optimal_temp_c)
-    temp_factor = max(0.5, 1.0 - temp_sensitivity * temp_deviation)
+    inputs = (
+        base_performance, ambient_temp_c, load_kg, max_load_kg,
+        route_elevation_gain_m, route_distance_km
+    )
+    if any(np.ndim(x) for x in inputs):
+        return _performance_with_environmental_factors_array(
+            *inputs, optimal_temp_c, temp_sensitivity
+        )
 
     # Load factor
     load_ratio = load_kg / max_load_kg if max_load_kg > 0 else 1.0
-    load_factor = max(0.7, 1.0 - 0.3 * load_ratio)
-
-    # Gradient factor (approximate)
-    avg_grade = route_elevation_gain_m / (route_distance_km * 1000) if route_distance_km > 0 else 0.0
-    gradient_factor = max(0.7, 1.0 - 10 * avg_grade)
 
     adjusted_performance = (
         base_performance
+        * _temperature_factor(ambient_temp_c, optimal_temp_c, temp_sensitivity)
+        * _load_factor(load_ratio)
+        * _gradient_factor(route_elevation_gain_m, route_distance_km)
+    )
+
+    return adjusted_performance
+
+
+@dataclass(frozen=True)
+class VehicleRouteContext:
+    """
+    Vehicle and route quantities reused across performance queries.
+
+    Maximum load and route geometry change far less often than ambient
+    temperature and payload. Build the context once per vehicle/route and
+    pass it to calculate_performance_with_context. This avoids recomputing
+    the load reciprocal and the gradient factor on every call.
+
+    Attributes
+    ----------
+    inv_max_load_kg : float or None
+        Reciprocal of the maximum rated load, or None when the maximum
+        load is not positive (load ratio is then taken as 1.0)
+    gradient_factor : float
+        Route gradient impact factor (0.7-1.0)
+    """
+    inv_max_load_kg: Optional[float]
+    gradient_factor: float
+
+    @classmethod
+    def from_vehicle_route(
+        cls,
+        max_load_kg: float,
+        route_elevation_gain_m: float,
+        route_distance_km: float
+    ) -> "VehicleRouteContext":
+        """Precompute the context for a vehicle on a given route."""
+        return cls(
+            inv_max_load_kg=1.0 / max_load_kg if max_load_kg > 0 else None,
+            gradient_factor=_gradient_factor(route_elevation_gain_m, route_distance_km),
+        )
+
+
+def calculate_performance_with_context(
+    base_performance: float,
+    ambient_temp_c: float,
+    load_kg: float,
+    context: VehicleRouteContext,
+    optimal_temp_c: float = 25.0,
+    temp_sensitivity: float = 0.01
+) -> float:
+    """
+    Calculate adjusted performance using a precomputed vehicle/route context.
+
+    Equivalent to calculate_performance_with_environmental_factors with the
+    maximum load and route geometry taken from ``context``.
+
+    Parameters
+    ----------
+    base_performance : float
+        Base performance metric (range, capacity, etc.)
+    ambient_temp_c : float
+        Ambient temperature (°C)
+    load_kg : float
+        Current load (kg)
+    context : VehicleRouteContext
+        Precomputed vehicle/route quantities
+    optimal_temp_c : float
+        Optimal operating temperature (°C)
+    temp_sensitivity : float
+        Performance loss per degree from optimal
+
+    Returns
+    -------
+    float
+        Adjusted performance
+
+    Examples
+    --------
+    >>> ctx = VehicleRouteContext.from_vehicle_route(36000, 100, 120)
+    >>> calculate_performance_with_context(300.0, 25.0, 18000, ctx)
+    252.875
+    """
+    inv_max_load = context.inv_max_load_kg
+    load_ratio = load_kg * inv_max_load if inv_max_load is not None else 1.0
+
+    return (
+        base_performance
+        * _temperature_factor(ambient_temp_c, optimal_temp_c, temp_sensitivity)
+        * _load_factor(load_ratio)
+        * context.gradient_factor
+    )
+
+
+def _temperature_factor(
+    ambient_temp_c: float,
+    optimal_temp_c: float,
+    temp_sensitivity: float
+) -> float:
+    """Scalar temperature factor, floored at 0.5."""
+    temp_factor = 1.0 - temp_sensitivity * abs(ambient_temp_c - optimal_temp_c)
+    return 0.5 if temp_factor < 0.5 else temp_factor
+
+
+def _load_factor(load_ratio: float) -> float:
+    """Scalar load factor, floored at 0.7."""
+    load_factor = 1.0 - 0.3 * load_ratio
+    return 0.7 if load_factor < 0.7 else load_factor
+
+
+def _gradient_factor(route_elevation_gain_m: float, route_distance_km: float) -> float:
+    """Scalar route gradient factor (approximate), floored at 0.7."""
+    avg_grade = route_elevation_gain_m / (route_distance_km * 1000) if route_distance_km > 0 else 0.0
+    gradient_factor = 1.0 - 10 * avg_grade
+    return 0.7 if gradient_factor < 0.7 else gradient_factor
+
+
+def _performance_with_environmental_factors_array(
+    base_performance,
+    ambient_temp_c,
+    load_kg,
+    max_load_kg,
+    route_elevation_gain_m,
+    route_distance_km,
+    optimal_temp_c: float,
+    temp_sensitivity: float
+) -> np.ndarray:
+    """Array path of calculate_performance_with_environmental_factors."""
+    ambient_temp_c = np.asarray(ambient_temp_c, dtype=np.float64)
+    load_kg = np.asarray(load_kg, dtype=np.float64)
+    max_load_kg = np.asarray(max_load_kg, dtype=np.float64)
+    route_elevation_gain_m = np.asarray(route_elevation_gain_m, dtype=np.float64)
+    route_distance_km = np.asarray(route_distance_km, dtype=np.float64)
+
+    temp_factor = np.maximum(
+        0.5, 1.0 - temp_sensitivity * np.abs(ambient_temp_c - optimal_temp_c)
+    )
+
+    # Reciprocals are taken once; the ratios are then plain multiplies
+    has_load = max_load_kg > 0
+    inv_max_load = np.reciprocal(max_load_kg, where=has_load, out=np.zeros_like(max_load_kg))
+    load_ratio = np.where(has_load, load_kg * inv_max_load, 1.0)
+
+    distance_m = route_distance_km * 1000
+    inv_distance_m = np.reciprocal(
+        distance_m, where=route_distance_km > 0, out=np.zeros_like(distance_m)
+    )
+    avg_grade = route_elevation_gain_m * inv_distance_m
+    load_factor = np.maximum(0.7, 1.0 - 0.3 * load_ratio)
+    gradient_factor = np.maximum(0.7, 1.0 - 10 * avg_grade)
+
+    return (
+        np.asarray(base_performance, dtype=np.float64)
         * temp_factor
         * load_factor
         * gradient_factor
     )
 
-    return adjusted_performance
+
+def calculate_battery_degradation_fleet(
+    initial_capacities: np.ndarray,
+    years: np.ndarray,
+    degradation_rate: float = BATTERY_DEGRADATION_RATE
+) -> np.ndarray:
+    """
+    Fleet variant of calculate_battery_degradation.
+
+    Takes and returns 1-D arrays (one entry per vehicle) so that simulation
+    loops can update every battery with a single call per step.
+    """
+    return np.atleast_1d(
+        calculate_battery_degradation(initial_capacities, years, degradation_rate)
+    )
+
+
+def calculate_combined_degradation_fleet(
+    initial_capacities: np.ndarray,
+    years: np.ndarray,
+    cycles: np.ndarray,
+    calendar_degradation_rate: float = BATTERY_DEGRADATION_RATE,
+    degradation_per_cycle: float = _DEFAULT_DEGRADATION_PER_CYCLE
+) -> np.ndarray:
+    """Fleet variant of calculate_combined_degradation (1-D in, 1-D out)."""
+    return np.atleast_1d(calculate_combined_degradation(
+        initial_capacities, years, cycles,
+        calendar_degradation_rate, degradation_per_cycle
+    ))
+
+
+def estimate_remaining_life_fleet(
+    current_capacities: np.ndarray,
+    initial_capacities: np.ndarray,
+    end_of_life_threshold: float = 0.80
+) -> np.ndarray:
+    """Fleet variant of estimate_remaining_life (1-D in, 1-D out)."""
+    return np.atleast_1d(estimate_remaining_life(
+        current_capacities, initial_capacities, end_of_life_threshold
+    ))
+
+
+def estimate_end_of_life_fleet(
+    current_capacities: np.ndarray,
+    initial_capacities: np.ndarray,
+    degradation_rate: float = BATTERY_DEGRADATION_RATE,
+    eol_threshold: float = 0.80
+) -> np.ndarray:
+    """Fleet variant of estimate_end_of_life (1-D in, 1-D out)."""
+    return np.atleast_1d(estimate_end_of_life(
+        current_capacities, initial_capacities, degradation_rate, eol_threshold
+    ))
+
+
+def calculate_operational_range_fleet(
+    rated_ranges: np.ndarray,
+    battery_performance_factors: np.ndarray,
+    temperature_factor: ArrayLike = 1.0,
+    load_factor: ArrayLike = 1.0,
+    gradient_factor: ArrayLike = 1.0
+) -> np.ndarray:
+    """Fleet variant of calculate_operational_range (1-D in, 1-D out)."""
+    return np.atleast_1d(calculate_operational_range(
+        rated_ranges, battery_performance_factors,
+        temperature_factor, load_factor, gradient_factor
+    ))
 
 
 __all__ = [
@@ -382,7 +750,15 @@ __all__ = [
     "calculate_combined_degradation",
     "estimate_remaining_life",
     "calculate_operational_range",
+    "calculate_effective_range_fused",
     "calculate_degradation_rate_from_trials",
     "estimate_end_of_life",
     "calculate_performance_with_environmental_factors",
+    "VehicleRouteContext",
+    "calculate_performance_with_context",
+    "calculate_battery_degradation_fleet",
+    "calculate_combined_degradation_fleet",
+    "estimate_remaining_life_fleet",
+    "estimate_end_of_life_fleet",
+    "calculate_operational_range_fleet",
 ]
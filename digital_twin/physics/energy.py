@@ -16,8 +16,11 @@ Validated with Queensland trial data:
 - 80 km/h typical average speed
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
-from typing import Union, Tuple
+from typing import Callable, Union, Tuple
 from digital_twin.core.constants import (
     GRAVITY_ACCELERATION,
     ROLLING_RESISTANCE_COEFF,
@@ -28,14 +31,38 @@ from digital_twin.core.constants import (
     FCET_H2_TO_WHEEL,
     DIESEL_TANK_TO_WHEEL,
     KG_H2_TO_KWH,
+    KWH_TO_JOULES,
+    TECH_BEV,
+    TECH_FCET,
+    TECH_DIESEL,
 )
 
+ArrayLike = Union[float, np.ndarray]
+
+# Technology-specific energy conversion: energy carrier and output unit
+_TECH_CARRIERS = {
+    'bev': ('battery', 'kWh'),
+    'fcet': ('hydrogen', 'kg_h2'),
+    'hydrogen': ('hydrogen', 'kg_h2'),
+    'diesel': ('diesel', 'liters'),
+}
+
+# Position of each technology's price in calculate_energy_cost's arguments
+_PRICE_INDEX = {'bev': 0, 'fcet': 1, 'hydrogen': 1, 'diesel': 2}
+
+
+def _as_float_array(x) -> ArrayLike:
+    """Convert array-like input to a float64 array; scalars become floats."""
+    if isinstance(x, (int, float)) or np.ndim(x) == 0:
+        return float(x)
+    return np.asarray(x, dtype=np.float64)
+
 
 def calculate_wheel_energy(
-    mass: float,
-    grade: float,
-    distance: float,
-    velocity: float,
+    mass: ArrayLike,
+    grade: ArrayLike,
+    distance: ArrayLike,
+    velocity: ArrayLike,
     air_density: float = AIR_DENSITY_SEA_LEVEL,
     frontal_area: float = DEFAULT_FRONTAL_AREA,
     drag_coefficient: float = DEFAULT_DRAG_COEFFICIENT,
@@ -48,13 +75,13 @@ def calculate_wheel_energy(
 
     Parameters
     ----------
-    mass : float
+    mass : float or np.ndarray
         Vehicle mass in kg
-    grade : float
+    grade : float or np.ndarray
         Road grade (slope angle in radians)
-    distance : float
+    distance : float or np.ndarray
         Distance traveled in meters
-    velocity : float
+    velocity : float or np.ndarray
         Vehicle velocity in m/s
     air_density : float
         Air density in kg/m³
@@ -67,25 +94,152 @@ def calculate_wheel_energy(
 
     Returns
     -------
-    float
-        Energy consumption in Joules
+    float or np.ndarray
+        Energy consumption in Joules; an array (one entry per trip) when
+        any of mass, grade, distance or velocity is array-like
     """
-    # Gravitational potential energy (climbing work)
-    E_gravity = mass * GRAVITY_ACCELERATION * np.sin(grade) * distance
+    mass = _as_float_array(mass)
+    grade = _as_float_array(grade)
+    distance = _as_float_array(distance)
+    velocity = _as_float_array(velocity)
+
+    k_aero = 0.5 * drag_coefficient * air_density * frontal_area
+
+    if isinstance(mass, float) and isinstance(grade, float) \
+            and isinstance(distance, float) and isinstance(velocity, float):
+        # Scalar path: math.sin avoids ufunc dispatch on a single value.
+        # Gravitational (climbing) and rolling resistance work share m·g·d
+        E_grade_rolling = mass * GRAVITY_ACCELERATION * distance * (
+            math.sin(grade) + rolling_resistance
+        )
+        E_aero = k_aero * velocity * velocity * distance
+        return E_grade_rolling + E_aero
+
+    # Array path: accumulate into one full-size buffer in place
+    E_wheel = np.empty(np.broadcast(mass, grade, distance, velocity).shape)
+    np.sin(grade, out=E_wheel)
+    E_wheel += rolling_resistance
+    E_wheel *= GRAVITY_ACCELERATION
+    E_wheel *= mass
+    E_wheel *= distance
+    E_wheel += k_aero * velocity * velocity * distance
 
-    # Rolling resistance energy
-    E_rolling = rolling_resistance * mass * GRAVITY_ACCELERATION * distance
+    return E_wheel
 
-    # Aerodynamic drag energy
-    E_aero = (
-        0.5 * drag_coefficient * air_density * frontal_area *
-        (velocity ** 2) * distance
-    )
 
-    # Total energy at wheel
-    E_wheel = E_gravity + E_rolling + E_aero
+@lru_cache(maxsize=256)
+def make_vehicle_wheel_energy_fn(
+    mass: float,
+    frontal_area: float = DEFAULT_FRONTAL_AREA,
+    drag_coefficient: float = DEFAULT_DRAG_COEFFICIENT,
+    rolling_resistance: float = ROLLING_RESISTANCE_COEFF,
+    air_density: float = AIR_DENSITY_SEA_LEVEL,
+) -> Callable[[float, float, float], float]:
+    """
+    Specialize calculate_wheel_energy for one fixed vehicle configuration.
 
-    return E_wheel
+    Mass and body coefficients are fixed per vehicle in a fleet rollout, so
+    they are folded into three constants once:
+    E = k_grade·sin(θ)·d + k_roll·d + k_aero·v²·d
+
+    Factories are memoized on the vehicle tuple, so repeated requests for
+    the same configuration return the same function object.
+
+    Parameters
+    ----------
+    mass : float
+        Vehicle mass in kg
+    frontal_area : float
+        Vehicle frontal area in m²
+    drag_coefficient : float
+        Aerodynamic drag coefficient
+    rolling_resistance : float
+        Rolling resistance coefficient
+    air_density : float
+        Air density in kg/m³
+
+    Returns
+    -------
+    callable
+        fn(grade, distance, velocity) -> wheel energy in Joules, for scalar
+        trips
+
+    Examples
+    --------
+    >>> wheel_energy = make_vehicle_wheel_energy_fn(36000.0)
+    >>> wheel_energy(0.0, 120000.0, 22.2) == calculate_wheel_energy(36000.0, 0.0, 120000.0, 22.2)
+    True
+    """
+    k_grade = mass * GRAVITY_ACCELERATION
+    k_roll = rolling_resistance * k_grade
+    k_aero = 0.5 * drag_coefficient * air_density * frontal_area
+    sin = math.sin
+
+    def wheel_energy(grade: float, distance: float, velocity: float) -> float:
+        return (k_grade * sin(grade) + k_roll + k_aero * velocity * velocity) * distance
+
+    return wheel_energy
+
+
+def calculate_wheel_energy_route(
+    mass: float,
+    grades: np.ndarray,
+    distances: np.ndarray,
+    velocity: ArrayLike,
+    air_density: float = AIR_DENSITY_SEA_LEVEL,
+    frontal_area: float = DEFAULT_FRONTAL_AREA,
+    drag_coefficient: float = DEFAULT_DRAG_COEFFICIENT,
+    rolling_resistance: float = ROLLING_RESISTANCE_COEFF,
+) -> float:
+    """
+    Integrate wheel energy over a discretized route profile.
+
+    Parameters
+    ----------
+    mass : float
+        Vehicle mass in kg
+    grades : np.ndarray
+        Road grade of each route segment (radians)
+    distances : np.ndarray
+        Length of each route segment in meters
+    velocity : float or np.ndarray
+        Vehicle velocity in m/s, constant or per segment
+    air_density : float
+        Air density in kg/m³
+    frontal_area : float
+        Vehicle frontal area in m²
+    drag_coefficient : float
+        Aerodynamic drag coefficient
+    rolling_resistance : float
+        Rolling resistance coefficient
+
+    Returns
+    -------
+    float
+        Total wheel energy over the route in Joules
+
+    Notes
+    -----
+    All segment sines are evaluated in one vectorized np.sin call. This is
+    faster under NumPy than stepping an angle-addition recurrence segment
+    by segment in Python, and it accumulates no drift.
+    """
+    grades = np.asarray(grades, dtype=np.float64)
+    distances = np.asarray(distances, dtype=np.float64)
+    velocity = np.asarray(velocity, dtype=np.float64)
+
+    # Σ m·g·d_i·(sin θ_i + C_rr) + ½ρC_dA·Σ v_i²·d_i
+    grade_rolling = np.sin(grades)
+    grade_rolling += rolling_resistance
+    E_grade_rolling = mass * GRAVITY_ACCELERATION * float(grade_rolling @ distances)
+
+    k_aero = 0.5 * drag_coefficient * air_density * frontal_area
+    if velocity.ndim == 0:
+        E_aero = k_aero * float(velocity) ** 2 * float(distances.sum())
+    else:
+        E_aero = k_aero * float((velocity * velocity) @ distances)
+
+    return E_grade_rolling + E_aero
 
 
 def calculate_energy_with_efficiency(
@@ -238,30 +392,41 @@ def calculate_technology_specific_energy(
     >>> print(f"{energy:.2f} {unit}")
     1.85 kg_h2
     """
-    tech = technology.lower()
+    scale, unit = _technology_scale(
+        technology, drivetrain_efficiency, battery_efficiency, fuelcell_efficiency
+    )
+    return wheel_energy_joules * scale, unit
 
-    if tech == 'bev':
-        # Battery electric
-        battery_energy_j = wheel_energy_joules / (drivetrain_efficiency * battery_efficiency)
-        battery_energy_kwh = battery_energy_j / 3_600_000
-        return battery_energy_kwh, 'kWh'
-
-    elif tech == 'fcet' or tech == 'hydrogen':
-        # Hydrogen fuel cell
-        h2_energy_j = wheel_energy_joules / (drivetrain_efficiency * fuelcell_efficiency)
-        h2_energy_kwh = h2_energy_j / 3_600_000
-        h2_kg = h2_energy_kwh / KG_H2_TO_KWH  # Convert to kg H2
-        return h2_kg, 'kg_h2'
-
-    elif tech == 'diesel':
-        # Diesel
-        diesel_energy_j = wheel_energy_joules / DIESEL_TANK_TO_WHEEL
-        diesel_energy_kwh = diesel_energy_j / 3_600_000
-        diesel_liters = diesel_energy_kwh / 10.0  # ~10 kWh per liter diesel
-        return diesel_liters, 'liters'
 
+@lru_cache(maxsize=64)
+def _technology_scale(
+    technology: str,
+    drivetrain_efficiency: float,
+    battery_efficiency: float,
+    fuelcell_efficiency: float
+) -> Tuple[float, str]:
+    """
+    Joules-at-wheel to technology-unit scale factor and unit name.
+
+    Memoized on the raw technology string, so repeated calls skip both the
+    case normalization and the efficiency arithmetic.
+    """
+    try:
+        carrier, unit = _TECH_CARRIERS[technology.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown technology: {technology}") from None
+
+    if carrier == 'battery':
+        # Battery electric
+        scale = 1.0 / (drivetrain_efficiency * battery_efficiency * 3_600_000)
+    elif carrier == 'hydrogen':
+        # Hydrogen fuel cell, converted to kg H2
+        scale = 1.0 / (drivetrain_efficiency * fuelcell_efficiency * 3_600_000 * KG_H2_TO_KWH)
     else:
-        raise ValueError(f"Unknown technology: {technology}")
+        # Diesel, ~10 kWh per liter
+        scale = 1.0 / (DIESEL_TANK_TO_WHEEL * 3_600_000 * 10.0)
+
+    return scale, unit
 
 
 def calculate_trip_energy_consumption(
@@ -283,13 +448,13 @@ def calculate_trip_energy_consumption(
 
     Parameters
     ----------
-    distance_km : float
+    distance_km : float or np.ndarray
         Trip distance (km), typical: 100-200 km from Queensland trials
-    mass_kg : float
+    mass_kg : float or np.ndarray
         Vehicle mass (kg), typical: 36,000 kg
-    grade_angle_rad : float
+    grade_angle_rad : float or np.ndarray
         Average route gradient (radians)
-    velocity_kmh : float
+    velocity_kmh : float or np.ndarray
         Average velocity (km/h), typical: 80 km/h
     technology : str
         Technology type: 'bev', 'fcet', 'diesel'
@@ -307,7 +472,8 @@ def calculate_trip_energy_consumption(
     Returns
     -------
     tuple
-        (energy_required, unit)
+        (energy_required, unit); energy_required is an array when any trip
+        input is array-like
 
     Notes
     -----
@@ -323,36 +489,119 @@ def calculate_trip_energy_consumption(
     ... )
     >>> print(f"Trip requires {energy:.1f} {unit}")
     """
-    # Convert units
-    distance_m = distance_km * 1000
-    velocity_ms = velocity_kmh / 3.6
-    trip_time_hours = distance_km / velocity_kmh
+    adjusted_energy = _trip_wheel_energy(
+        distance_km, mass_kg, grade_angle_rad, velocity_kmh,
+        auxiliary_power_kw, temperature_factor,
+        rolling_resistance, drag_coefficient, frontal_area
+    )
+
+    # Get technology-specific consumption
+    consumption, unit = calculate_technology_specific_energy(
+        adjusted_energy, technology
+    )
 
-    # Calculate wheel energy
+    return consumption, unit
+
+
+def _trip_wheel_energy(
+    distance_km: ArrayLike,
+    mass_kg: ArrayLike,
+    grade_angle_rad: ArrayLike,
+    velocity_kmh: ArrayLike,
+    auxiliary_power_kw: float,
+    temperature_factor: ArrayLike,
+    rolling_resistance: float,
+    drag_coefficient: float,
+    frontal_area: float
+) -> ArrayLike:
+    """Temperature-adjusted wheel + auxiliary energy for a trip (Joules)."""
+    distance_km = _as_float_array(distance_km)
+    velocity_kmh = _as_float_array(velocity_kmh)
+
+    # Calculate wheel energy (SI units)
     wheel_energy = calculate_wheel_energy(
         mass=mass_kg,
         grade=grade_angle_rad,
-        distance=distance_m,
-        velocity=velocity_ms,
+        distance=distance_km * 1000,
+        velocity=velocity_kmh / 3.6,
         rolling_resistance=rolling_resistance,
         frontal_area=frontal_area,
         drag_coefficient=drag_coefficient,
     )
 
-    # Add auxiliary energy
-    auxiliary_energy_j = auxiliary_power_kw * 1000 * trip_time_hours * 3600
+    # Add auxiliary energy: kW × (km / km·h⁻¹) hours, in Joules
+    auxiliary_energy_j = auxiliary_power_kw * KWH_TO_JOULES * distance_km / velocity_kmh
 
     total_wheel_energy = wheel_energy + auxiliary_energy_j
 
     # Apply temperature factor
-    adjusted_energy = total_wheel_energy / temperature_factor
+    return total_wheel_energy / _as_float_array(temperature_factor)
 
-    # Get technology-specific consumption
-    consumption, unit = calculate_technology_specific_energy(
-        adjusted_energy, technology
-    )
 
-    return consumption, unit
+def calculate_trip_energy_consumption_batch(
+    distance_km: np.ndarray,
+    mass_kg: np.ndarray,
+    grade_angle_rad: np.ndarray,
+    velocity_kmh: np.ndarray,
+    tech_codes: np.ndarray,
+    auxiliary_power_kw: float = 5.0,
+    temperature_factor: ArrayLike = 1.0,
+    drivetrain_efficiency: float = 0.90,
+    battery_efficiency: float = 0.94,
+    fuelcell_efficiency: float = 0.50
+) -> np.ndarray:
+    """
+    Calculate trip energy consumption for a mixed-technology batch of trips.
+
+    Array counterpart of calculate_trip_energy_consumption for Monte Carlo
+    and fleet rollouts: the technology of each trip is given as an integer
+    code (TECH_BEV, TECH_FCET, TECH_DIESEL from digital_twin.core.constants),
+    and the conversion is a per-code scale gathered from a small table.
+
+    Parameters
+    ----------
+    distance_km, mass_kg, grade_angle_rad, velocity_kmh : np.ndarray
+        Trip inputs as in calculate_trip_energy_consumption, broadcastable
+        against each other
+    tech_codes : np.ndarray
+        Integer technology code per trip
+    auxiliary_power_kw : float
+        Auxiliary power for HVAC, etc. (kW)
+    temperature_factor : float or np.ndarray
+        Temperature impact factor (0-1)
+    drivetrain_efficiency, battery_efficiency, fuelcell_efficiency : float
+        Efficiencies as in calculate_technology_specific_energy
+
+    Returns
+    -------
+    np.ndarray
+        Energy required per trip in the technology's unit: kWh for BEV,
+        kg H2 for FCET, liters for diesel
+
+    Raises
+    ------
+    ValueError
+        If any code is not one of TECH_BEV, TECH_FCET or TECH_DIESEL.
+    """
+    tech_codes = np.asarray(tech_codes, dtype=np.intp)
+
+    # Joules at the wheel -> technology unit, indexed by tech code
+    efficiencies = (drivetrain_efficiency, battery_efficiency, fuelcell_efficiency)
+    scale = np.full(max(TECH_BEV, TECH_FCET, TECH_DIESEL) + 1, np.nan)
+    scale[TECH_BEV] = _technology_scale('bev', *efficiencies)[0]
+    scale[TECH_FCET] = _technology_scale('fcet', *efficiencies)[0]
+    scale[TECH_DIESEL] = _technology_scale('diesel', *efficiencies)[0]
+
+    if np.any((tech_codes < 0) | (tech_codes >= len(scale))) or np.isnan(scale[tech_codes]).any():
+        raise ValueError("tech_codes must be TECH_BEV, TECH_FCET or TECH_DIESEL")
+
+    adjusted_energy = _trip_wheel_energy(
+        np.asarray(distance_km, dtype=np.float64), mass_kg, grade_angle_rad,
+        np.asarray(velocity_kmh, dtype=np.float64),
+        auxiliary_power_kw, temperature_factor,
+        ROLLING_RESISTANCE_COEFF, DEFAULT_DRAG_COEFFICIENT, DEFAULT_FRONTAL_AREA
+    )
+    return adjusted_energy * scale[tech_codes]
 
 
 def calculate_energy_cost(
@@ -393,17 +642,13 @@ def calculate_energy_cost(
     >>> calculate_energy_cost(10, 'fcet', h2_price_per_kg=10.0)
     100.0
     """
-    tech = technology.lower()
-
-    if tech == 'bev':
-        return energy_amount * electricity_price_per_kwh
-    elif tech == 'fcet' or tech == 'hydrogen':
-        return energy_amount * h2_price_per_kg
-    elif tech == 'diesel':
-        return energy_amount * diesel_price_per_liter
-    else:
+    price_index = _PRICE_INDEX.get(technology.lower())
+    if price_index is None:
         return 0.0
 
+    prices = (electricity_price_per_kwh, h2_price_per_kg, diesel_price_per_liter)
+    return energy_amount * prices[price_index]
+
 
 def calculate_energy_efficiency_comparison(
     distance_km: float,
@@ -439,31 +684,34 @@ def calculate_energy_efficiency_comparison(
     if technologies is None:
         technologies = ['bev', 'fcet', 'diesel']
 
-    results = {}
-
-    for tech in technologies:
-        try:
-            consumption, unit = calculate_trip_energy_consumption(
-                distance_km=distance_km,
-                mass_kg=mass_kg,
-                grade_angle_rad=0.0,
-                velocity_kmh=80.0,
-                technology=tech
-            )
-            results[tech] = (consumption, unit)
-        except ValueError:
-            pass
+    # The trip's wheel energy does not depend on technology; compute it once
+    adjusted_energy = _trip_wheel_energy(
+        distance_km, mass_kg, 0.0, 80.0,
+        auxiliary_power_kw=5.0,
+        temperature_factor=1.0,
+        rolling_resistance=ROLLING_RESISTANCE_COEFF,
+        drag_coefficient=DEFAULT_DRAG_COEFFICIENT,
+        frontal_area=DEFAULT_FRONTAL_AREA,
+    )
 
-    return results
+    # Only the conversion scale differs per technology; unknown names are skipped
+    return {
+        tech: calculate_technology_specific_energy(adjusted_energy, tech)
+        for tech in technologies
+        if tech.lower() in _TECH_CARRIERS
+    }
 
 
 __all__ = [
     "calculate_wheel_energy",
+    "calculate_wheel_energy_route",
+    "make_vehicle_wheel_energy_fn",
     "calculate_energy_with_efficiency",
     "calculate_regenerative_braking_energy",
     "calculate_specific_energy_consumption",
     "calculate_technology_specific_energy",
     "calculate_trip_energy_consumption",
+    "calculate_trip_energy_consumption_batch",
     "calculate_energy_cost",
     "calculate_energy_efficiency_comparison",
 ]
@@ -6,6 +6,15 @@ battery performance, HVAC loads, and component efficiency.
 """
 
 import numpy as np
+from typing import Union
+
+ArrayLike = Union[float, np.ndarray]
+
+# Standard atmosphere constants for the barometric density model
+_T0_K = 288.15  # Sea level standard temperature (K)
+_RHO0 = 1.225  # Sea level air density (kg/m³)
+_LAPSE_OVER_T0 = 0.0065 / _T0_K  # Temperature lapse rate / T₀ (1/m)
+_BAROMETRIC_EXPONENT = 4.256  # g/(R×0.0065) - 1 with g = 9.81, R = 287.05
 
 
 def calculate_battery_temperature_factor(
@@ -30,11 +39,34 @@ def calculate_battery_temperature_factor(
         Performance factor (1.0 = optimal, <1.0 = reduced)
     """
     # Simple model: performance drops 1% per degree from optimal
-    temp_diff = abs(ambient_temp_celsius - optimal_temp)
-    factor = 1.0 - (temp_diff * 0.01)
+    temp_diff = ambient_temp_celsius - optimal_temp
+    factor = 1.0 - 0.01 * (temp_diff if temp_diff >= 0 else -temp_diff)
 
     # Limit between 0.5 and 1.0
-    return max(0.5, min(1.0, factor))
+    return 0.5 if factor < 0.5 else (1.0 if factor > 1.0 else factor)
+
+
+def calculate_battery_temperature_factor_batch(
+    ambient_temp_celsius: np.ndarray,
+    optimal_temp: float = 25.0
+) -> np.ndarray:
+    """
+    Vectorized battery performance factor over an array of temperatures.
+
+    Parameters
+    ----------
+    ambient_temp_celsius : np.ndarray
+        Ambient temperatures in Celsius
+    optimal_temp : float
+        Optimal operating temperature
+
+    Returns
+    -------
+    np.ndarray
+        Performance factors, clipped to [0.5, 1.0]
+    """
+    temp_diff = np.abs(np.asarray(ambient_temp_celsius, dtype=np.float64) - optimal_temp)
+    return np.clip(1.0 - 0.01 * temp_diff, 0.5, 1.0)
 
 
 def calculate_hvac_load(
@@ -72,45 +104,41 @@ def calculate_hvac_load(
 
 
 def calculate_air_density_correction(
-    altitude_m: float,
-    temp_celsius: float = 15.0
-) -> float:
+    altitude_m: ArrayLike,
+    temp_celsius: ArrayLike = 15.0
+) -> ArrayLike:
     """
     Calculate air density correction for altitude and temperature.
 
     Parameters
     ----------
-    altitude_m : float
+    altitude_m : float or np.ndarray
         Altitude in meters
-    temp_celsius : float
+    temp_celsius : float or np.ndarray
         Temperature in Celsius
 
     Returns
     -------
-    float
-        Air density in kg/m³
+    float or np.ndarray
+        Air density in kg/m³, broadcast over array inputs
     """
     # Standard atmospheric model
     # ρ = ρ₀ × (1 - 0.0065h/T₀)^(g/(R×0.0065))
-
-    T0 = 288.15  # Sea level standard temperature (K)
-    rho0 = 1.225  # Sea level air density (kg/m³)
-    g = 9.81
-    R = 287.05  # Specific gas constant for dry air
+    if np.ndim(altitude_m) or np.ndim(temp_celsius):
+        altitude_m = np.asarray(altitude_m, dtype=np.float64)
+        temp_celsius = np.asarray(temp_celsius, dtype=np.float64)
 
     temp_kelvin = temp_celsius + 273.15
 
-    # Simplified formula
-    rho = rho0 * (1 - (0.0065 * altitude_m) / T0) ** 4.256
-
-    # Temperature correction
-    rho = rho * (T0 / temp_kelvin)
+    # Simplified formula with temperature correction
+    rho = _RHO0 * (1 - _LAPSE_OVER_T0 * altitude_m) ** _BAROMETRIC_EXPONENT
 
-    return rho
+    return rho * (_T0_K / temp_kelvin)
 
 
 __all__ = [
     "calculate_battery_temperature_factor",
+    "calculate_battery_temperature_factor_batch",
     "calculate_hvac_load",
     "calculate_air_density_correction",
 ]
@@ -1,11 +1,13 @@
 """Simulation module."""
 
-from digital_twin.simulation.monte_carlo import MonteCarloSimulator
+from digital_twin.simulation.monte_carlo import MonteCarloSimulator, run_all
 from digital_twin.simulation.scenarios import create_scenario, compare_scenarios
 from digital_twin.simulation.forecasting import forecast_trend
-from digital_twin.simulation.sensitivity import calculate_sensitivity
+from digital_twin.simulation.sensitivity import (
+    calculate_sensitivity, calculate_sensitivity_arrays,
+)
 
 __all__ = [
-    "MonteCarloSimulator", "create_scenario", "compare_scenarios",
-    "forecast_trend", "calculate_sensitivity",
+    "MonteCarloSimulator", "run_all", "create_scenario", "compare_scenarios",
+    "forecast_trend", "calculate_sensitivity", "calculate_sensitivity_arrays",
 ]
@@ -4,11 +4,23 @@ import numpy as np
 
 
 def forecast_trend(historical_data: np.ndarray, periods: int) -> np.ndarray:
-    """Simple linear trend forecast."""
-    x = np.arange(len(historical_data))
-    coeffs = np.polyfit(x, historical_data, 1)
-    future_x = np.arange(len(historical_data), len(historical_data) + periods)
-    return np.polyval(coeffs, future_x)
+    """Simple linear trend forecast (closed-form least-squares line)."""
+    y = np.asarray(historical_data, dtype=np.float64)
+    n = len(y)
+
+    # x = 0..n-1, so its mean and variance have closed forms
+    x_mean = (n - 1) / 2.0
+    y_mean = y.mean()
+    x_var = n * (n * n - 1) / 12.0
+
+    if n < 2:
+        slope = 0.0  # a single point gives a flat trend
+    else:
+        slope = ((np.arange(n, dtype=np.float64) - x_mean) @ (y - y_mean)) / x_var
+    intercept = y_mean - slope * x_mean
+
+    future_x = np.arange(n, n + periods, dtype=np.float64)
+    return intercept + slope * future_x
 
 
 __all__ = ["forecast_trend"]
@@ -1,27 +1,122 @@
 """Monte Carlo simulation engine."""
 
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
 from digital_twin.core.constants import DEFAULT_N_SIMULATIONS
+from digital_twin.physics.energy import calculate_trip_energy_consumption_batch
+
+# Placeholder NPV distribution used until scenarios carry cash-flow models
+_NPV_MEAN = 50000.0
+_NPV_STD = 20000.0
+
+# Shared PCG64 generator for unseeded runs; avoids re-initializing state per call
+_RNG = np.random.default_rng()
+
+
+def _summarize(values: np.ndarray) -> Dict:
+    """Mean, standard deviation and 5th/95th percentiles of a sample."""
+    p05, p95 = np.percentile(values, [5, 95])
+    return {
+        "mean": float(values.mean()),
+        "std": float(values.std()),
+        "p05": float(p05),
+        "p95": float(p95),
+    }
 
 
 class MonteCarloSimulator:
     """Monte Carlo simulation for risk analysis."""
 
-    def __init__(self, scenario, n_iterations: int = DEFAULT_N_SIMULATIONS):
+    def __init__(
+        self,
+        scenario,
+        n_iterations: int = DEFAULT_N_SIMULATIONS,
+        seed: Optional[int] = None
+    ):
         self.scenario = scenario
         self.n_iterations = n_iterations
+        self.rng = _RNG if seed is None else np.random.default_rng(seed)
 
     def run(self) -> Dict:
         """Run Monte Carlo simulation."""
-        results = {
-            "npv_values": np.random.normal(50000, 20000, self.n_iterations),
-            "mean": 50000,
-            "std": 20000,
-            "p05": 30000,
-            "p95": 70000,
-        }
-        return results
+        npv_values = self.rng.normal(_NPV_MEAN, _NPV_STD, self.n_iterations)
+        return {"npv_values": npv_values, **_summarize(npv_values)}
+
+    def run_batched(self, param_arrays: Dict[str, np.ndarray]) -> Dict:
+        """
+        Evaluate trip energy for a whole batch of sampled scenarios at once.
+
+        Parameters
+        ----------
+        param_arrays : dict
+            One array per parameter, one entry per iteration:
+            'distance_km', 'mass_kg', 'grade_angle_rad', 'velocity_kmh' and
+            'tech_codes' (TECH_BEV / TECH_FCET / TECH_DIESEL), plus optional
+            'temperature_factor'
+
+        Returns
+        -------
+        dict
+            'energy_values' (technology units per iteration) and their
+            mean, std, p05 and p95
+        """
+        energy_values = calculate_trip_energy_consumption_batch(
+            param_arrays["distance_km"],
+            param_arrays["mass_kg"],
+            param_arrays["grade_angle_rad"],
+            param_arrays["velocity_kmh"],
+            param_arrays["tech_codes"],
+            temperature_factor=param_arrays.get("temperature_factor", 1.0),
+        )
+        return {"energy_values": energy_values, **_summarize(energy_values)}
+
+
+def run_all(
+    scenarios: List[Dict],
+    n_iterations: int = DEFAULT_N_SIMULATIONS,
+    seed: Optional[int] = None
+) -> Dict:
+    """
+    Run the NPV Monte Carlo for several scenarios with a single draw.
+
+    All scenarios share one (n_scenarios, n_iterations) standard-normal
+    draw, scaled per scenario, so the cost no longer grows with a Python
+    loop over scenarios.
+
+    Parameters
+    ----------
+    scenarios : list of dict
+        Scenarios as built by create_scenario; optional 'npv_mean' and
+        'npv_std' keys override the default NPV distribution
+    n_iterations : int
+        Samples per scenario
+    seed : int, optional
+        Seed for a dedicated generator; the shared module generator is
+        used when omitted
+
+    Returns
+    -------
+    dict
+        'names', 'npv_values' of shape (n_scenarios, n_iterations), and
+        per-scenario 'mean', 'std', 'p05' and 'p95' arrays
+    """
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    means = np.array([s.get("npv_mean", _NPV_MEAN) for s in scenarios], dtype=np.float64)
+    stds = np.array([s.get("npv_std", _NPV_STD) for s in scenarios], dtype=np.float64)
+
+    npv_values = rng.standard_normal((len(scenarios), n_iterations))
+    npv_values *= stds[:, None]
+    npv_values += means[:, None]
+
+    p05, p95 = np.percentile(npv_values, [5, 95], axis=1)
+    return {
+        "names": [s.get("name") for s in scenarios],
+        "npv_values": npv_values,
+        "mean": npv_values.mean(axis=1),
+        "std": npv_values.std(axis=1),
+        "p05": p05,
+        "p95": p95,
+    }
 
 
-__all__ = ["MonteCarloSimulator"]
+__all__ = ["MonteCarloSimulator", "run_all"]
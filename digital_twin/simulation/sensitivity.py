@@ -1,15 +1,54 @@
 """Parameter sensitivity and tornado charts."""
 
+from typing import Sequence
+
 import numpy as np
 
+# Simplified impact of a parameter variation on the output
+_IMPACT_FACTOR = 0.1
+
+
+def calculate_sensitivity_arrays(
+    keys: Sequence[str],
+    variations: np.ndarray,
+    base_value: float
+) -> np.ndarray:
+    """
+    Calculate parameter sensitivity for parallel key/variation arrays.
+
+    Hot callers (tornado charts, per-vehicle sensitivity) can use this
+    directly and skip the dict round trip of calculate_sensitivity.
+
+    Parameters
+    ----------
+    keys : sequence of str
+        Parameter names, aligned with variations
+    variations : array-like
+        Variation of each parameter
+    base_value : float
+        Base output value
+
+    Returns
+    -------
+    np.ndarray
+        Sensitivity per parameter, same order as keys
+    """
+    variations = np.asarray(variations, dtype=np.float64)
+    if variations.shape != (len(keys),):
+        raise ValueError(
+            f"Expected {len(keys)} variations, got shape {variations.shape}"
+        )
+    return variations * (_IMPACT_FACTOR / base_value)
+
 
 def calculate_sensitivity(base_value: float, param_variation: dict) -> dict:
     """Calculate parameter sensitivity."""
-    sensitivity = {}
-    for param, variation in param_variation.items():
-        impact = variation * 0.1  # Simplified
-        sensitivity[param] = impact / base_value
-    return sensitivity
+    keys = tuple(param_variation)
+    variations = np.fromiter(
+        param_variation.values(), dtype=np.float64, count=len(keys)
+    )
+    impacts = calculate_sensitivity_arrays(keys, variations, base_value)
+    return dict(zip(keys, impacts.tolist()))
 
 
-__all__ = ["calculate_sensitivity"]
+__all__ = ["calculate_sensitivity", "calculate_sensitivity_arrays"]
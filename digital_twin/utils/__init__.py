@@ -5,49 +5,46 @@ This module provides mathematical utilities, conversions, date handling,
 validators, and formatters.
 """
 
-from digital_twin.utils.math_utils import (
-    linear_interpolate,
-    exponential_decay,
-    calculate_gradient,
-    moving_average,
-    compound_growth,
-)
+import importlib
 
-from digital_twin.utils.conversions import (
-    km_to_miles,
-    miles_to_km,
-    kmh_to_ms,
-    ms_to_kmh,
-    kwh_to_joules,
-    joules_to_kwh,
-    liter_diesel_to_kwh,
-    kg_h2_to_kwh,
-    celsius_to_fahrenheit,
-    kg_to_tonnes,
-)
-
-from digital_twin.utils.date_utils import (
-    add_years,
-    years_between,
-    generate_date_range,
-)
-
-from digital_twin.utils.validators import (
-    is_positive,
-    is_non_negative,
-    is_percentage,
-    is_in_range,
-)
-
-from digital_twin.utils.formatters import (
-    format_currency,
-    format_percentage,
-    format_number,
-    format_large_number,
-    format_distance,
-    format_energy,
-    format_co2,
-)
+# Public name -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so importing the package stays cheap.
+_LAZY = {
+    "linear_interpolate": "digital_twin.utils.math_utils",
+    "exponential_decay": "digital_twin.utils.math_utils",
+    "calculate_gradient": "digital_twin.utils.math_utils",
+    "moving_average": "digital_twin.utils.math_utils",
+    "compound_growth": "digital_twin.utils.math_utils",
+    "Conversion": "digital_twin.utils.conversions",
+    "convert": "digital_twin.utils.conversions",
+    "km_to_miles": "digital_twin.utils.conversions",
+    "miles_to_km": "digital_twin.utils.conversions",
+    "kmh_to_ms": "digital_twin.utils.conversions",
+    "ms_to_kmh": "digital_twin.utils.conversions",
+    "kwh_to_joules": "digital_twin.utils.conversions",
+    "joules_to_kwh": "digital_twin.utils.conversions",
+    "liter_diesel_to_kwh": "digital_twin.utils.conversions",
+    "kg_h2_to_kwh": "digital_twin.utils.conversions",
+    "celsius_to_fahrenheit": "digital_twin.utils.conversions",
+    "kg_to_tonnes": "digital_twin.utils.conversions",
+    "add_years": "digital_twin.utils.date_utils",
+    "years_between": "digital_twin.utils.date_utils",
+    "generate_date_range": "digital_twin.utils.date_utils",
+    "is_positive": "digital_twin.utils.validators",
+    "is_non_negative": "digital_twin.utils.validators",
+    "is_percentage": "digital_twin.utils.validators",
+    "is_in_range": "digital_twin.utils.validators",
+    "format_currency": "digital_twin.utils.formatters",
+    "format_currency_array": "digital_twin.utils.formatters",
+    "format_percentage": "digital_twin.utils.formatters",
+    "format_number": "digital_twin.utils.formatters",
+    "format_large_number": "digital_twin.utils.formatters",
+    "format_large_number_array": "digital_twin.utils.formatters",
+    "format_distance": "digital_twin.utils.formatters",
+    "format_energy": "digital_twin.utils.formatters",
+    "format_co2": "digital_twin.utils.formatters",
+    "format_co2_array": "digital_twin.utils.formatters",
+}
 
 __all__ = [
     # Math utils
@@ -57,6 +54,8 @@ __all__ = [
     "moving_average",
     "compound_growth",
     # Conversions
+    "Conversion",
+    "convert",
     "km_to_miles",
     "miles_to_km",
     "kmh_to_ms",
@@ -78,10 +77,36 @@ __all__ = [
     "is_in_range",
     # Formatters
     "format_currency",
+    "format_currency_array",
     "format_percentage",
     "format_number",
     "format_large_number",
+    "format_large_number_array",
     "format_distance",
     "format_energy",
     "format_co2",
+    "format_co2_array",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY.get(name)
+    if module_path is not None:
+        value = getattr(importlib.import_module(module_path), name)
+    else:
+        # Not-yet-imported submodules stay reachable as attributes
+        submodule = f"{__name__}.{name}"
+        try:
+            value = importlib.import_module(submodule)
+        except ModuleNotFoundError as exc:
+            if exc.name != submodule:
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -5,191 +5,341 @@ This module provides conversion functions between different units
 commonly used in fleet decarbonization analysis.
 """
 
+from enum import IntEnum
 from typing import Union
 import numpy as np
 
+ArrayLike = Union[float, np.ndarray]
+
+
+class Conversion(IntEnum):
+    """Index of each unit conversion in the factor tables."""
+
+    KM_TO_MILES = 0
+    MILES_TO_KM = 1
+    M_TO_KM = 2
+    KM_TO_M = 3
+    KMH_TO_MS = 4
+    MS_TO_KMH = 5
+    MPH_TO_KMH = 6
+    KMH_TO_MPH = 7
+    KWH_TO_JOULES = 8
+    JOULES_TO_KWH = 9
+    KWH_TO_MJ = 10
+    MJ_TO_KWH = 11
+    LITER_DIESEL_TO_KWH = 12
+    KWH_TO_LITER_DIESEL = 13
+    KG_H2_TO_KWH = 14
+    KWH_TO_KG_H2 = 15
+    KG_TO_TONNES = 16
+    TONNES_TO_KG = 17
+    KG_TO_LBS = 18
+    LBS_TO_KG = 19
+    CELSIUS_TO_FAHRENHEIT = 20
+    FAHRENHEIT_TO_CELSIUS = 21
+    CELSIUS_TO_KELVIN = 22
+    KELVIN_TO_CELSIUS = 23
+    KW_TO_HP = 24
+    HP_TO_KW = 25
+    BAR_TO_PSI = 26
+    PSI_TO_BAR = 27
+    LITERS_TO_GALLONS_US = 28
+    GALLONS_US_TO_LITERS = 29
+    M2_TO_FT2 = 30
+    FT2_TO_M2 = 31
+    DECIMAL_TO_PERCENTAGE = 32
+    PERCENTAGE_TO_DECIMAL = 33
+
+
+# Every conversion is the affine map (x + offset_in) * factor / divisor + offset_out.
+# Inverse conversions divide by the forward factor rather than multiplying
+# by a rounded reciprocal, so round trips stay exact (7.2e6 J -> 2.0 kWh).
+# Rows: (factor, divisor, offset_in, offset_out), in Conversion order.
+_TABLE = (
+    (0.621371, 1.0, 0.0, 0.0),      # km -> miles
+    (1.60934, 1.0, 0.0, 0.0),       # miles -> km
+    (1.0, 1000.0, 0.0, 0.0),        # m -> km
+    (1000.0, 1.0, 0.0, 0.0),        # km -> m
+    (1.0, 3.6, 0.0, 0.0),           # km/h -> m/s
+    (3.6, 1.0, 0.0, 0.0),           # m/s -> km/h
+    (1.60934, 1.0, 0.0, 0.0),       # mph -> km/h
+    (0.621371, 1.0, 0.0, 0.0),      # km/h -> mph
+    (3_600_000, 1.0, 0.0, 0.0),     # kWh -> J
+    (1.0, 3_600_000, 0.0, 0.0),     # J -> kWh
+    (3.6, 1.0, 0.0, 0.0),           # kWh -> MJ
+    (1.0, 3.6, 0.0, 0.0),           # MJ -> kWh
+    (10.0, 1.0, 0.0, 0.0),          # L diesel -> kWh (~10 kWh per liter)
+    (1.0, 10.0, 0.0, 0.0),          # kWh -> L diesel
+    (33.3, 1.0, 0.0, 0.0),          # kg H2 -> kWh (~33.3 kWh per kg H2)
+    (1.0, 33.3, 0.0, 0.0),          # kWh -> kg H2
+    (1.0, 1000.0, 0.0, 0.0),        # kg -> t
+    (1000.0, 1.0, 0.0, 0.0),        # t -> kg
+    (2.20462, 1.0, 0.0, 0.0),       # kg -> lbs
+    (1.0, 2.20462, 0.0, 0.0),       # lbs -> kg
+    (9.0, 5.0, 0.0, 32.0),          # °C -> °F
+    (5.0, 9.0, -32.0, 0.0),         # °F -> °C
+    (1.0, 1.0, 273.15, 0.0),        # °C -> K
+    (1.0, 1.0, -273.15, 0.0),       # K -> °C
+    (1.34102, 1.0, 0.0, 0.0),       # kW -> hp
+    (1.0, 1.34102, 0.0, 0.0),       # hp -> kW
+    (14.5038, 1.0, 0.0, 0.0),       # bar -> psi
+    (1.0, 14.5038, 0.0, 0.0),       # psi -> bar
+    (0.264172, 1.0, 0.0, 0.0),      # L -> US gal
+    (1.0, 0.264172, 0.0, 0.0),      # US gal -> L
+    (10.7639, 1.0, 0.0, 0.0),       # m² -> ft²
+    (1.0, 10.7639, 0.0, 0.0),       # ft² -> m²
+    (100, 1.0, 0.0, 0.0),           # decimal -> %
+    (1.0, 100.0, 0.0, 0.0),         # % -> decimal
+)
+
+_FACTOR, _DIVISOR, _OFFSET_IN, _OFFSET_OUT = (
+    np.array(column, dtype=np.float64) for column in zip(*_TABLE)
+)
+
+
+def convert(kind: Union[Conversion, int, np.ndarray], x: ArrayLike) -> ArrayLike:
+    """
+    Apply a unit conversion from the factor tables.
+
+    Parameters
+    ----------
+    kind : Conversion, int or np.ndarray
+        Conversion index; an integer array converts each element of x with
+        its own conversion in a single pass
+    x : float or np.ndarray
+        Value(s) to convert
+
+    Returns
+    -------
+    float or np.ndarray
+        Converted value(s); a float for a scalar kind and scalar x
+
+    Examples
+    --------
+    >>> convert(Conversion.KM_TO_M, 2.5)
+    2500.0
+    >>> convert(np.array([Conversion.KM_TO_M, Conversion.KG_TO_TONNES]),
+    ...         np.array([2.5, 18000.0]))
+    array([2500.,   18.])
+    """
+    result = (x + _OFFSET_IN[kind]) * _FACTOR[kind] / _DIVISOR[kind] + _OFFSET_OUT[kind]
+    if isinstance(result, np.generic):
+        return float(result)
+    return result
+
+
+def _apply(kind: Conversion, x: ArrayLike) -> ArrayLike:
+    """
+    Apply one table row to x, skipping its identity terms.
+
+    Plain scale conversions cost a single multiply or divide, and the
+    integer-valued factors keep integer inputs integral.
+    """
+    factor, divisor, offset_in, offset_out = _TABLE[kind]
+
+    if offset_in or offset_out:
+        if not isinstance(x, np.ndarray):
+            return (x + offset_in) * factor / divisor + offset_out
+        # Arrays: one output buffer updated in place, skipping identity
+        # steps, instead of a temporary per operator
+        out = np.add(x, offset_in, dtype=np.result_type(x, 1.0))
+        if factor != 1.0:
+            out *= factor
+        if divisor != 1.0:
+            out /= divisor
+        if offset_out:
+            out += offset_out
+        return out
+    if factor == 1.0:
+        return x / divisor
+    if divisor == 1.0:
+        return x * factor
+    return x * factor / divisor
+
 
 # Distance conversions
-def km_to_miles(km: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def km_to_miles(km: ArrayLike) -> ArrayLike:
     """Convert kilometers to miles."""
-    return km * 0.621371
+    return _apply(Conversion.KM_TO_MILES, km)
 
 
-def miles_to_km(miles: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def miles_to_km(miles: ArrayLike) -> ArrayLike:
     """Convert miles to kilometers."""
-    return miles * 1.60934
+    return _apply(Conversion.MILES_TO_KM, miles)
 
 
-def m_to_km(meters: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def m_to_km(meters: ArrayLike) -> ArrayLike:
     """Convert meters to kilometers."""
-    return meters / 1000.0
+    return _apply(Conversion.M_TO_KM, meters)
 
 
-def km_to_m(km: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def km_to_m(km: ArrayLike) -> ArrayLike:
     """Convert kilometers to meters."""
-    return km * 1000.0
+    return _apply(Conversion.KM_TO_M, km)
 
 
 # Speed conversions
-def kmh_to_ms(kmh: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kmh_to_ms(kmh: ArrayLike) -> ArrayLike:
     """Convert km/h to m/s."""
-    return kmh / 3.6
+    return _apply(Conversion.KMH_TO_MS, kmh)
 
 
-def ms_to_kmh(ms: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def ms_to_kmh(ms: ArrayLike) -> ArrayLike:
     """Convert m/s to km/h."""
-    return ms * 3.6
+    return _apply(Conversion.MS_TO_KMH, ms)
 
 
-def mph_to_kmh(mph: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def mph_to_kmh(mph: ArrayLike) -> ArrayLike:
     """Convert miles per hour to km/h."""
-    return mph * 1.60934
+    return _apply(Conversion.MPH_TO_KMH, mph)
 
 
-def kmh_to_mph(kmh: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kmh_to_mph(kmh: ArrayLike) -> ArrayLike:
     """Convert km/h to miles per hour."""
-    return kmh * 0.621371
+    return _apply(Conversion.KMH_TO_MPH, kmh)
 
 
 # Energy conversions
-def kwh_to_joules(kwh: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kwh_to_joules(kwh: ArrayLike) -> ArrayLike:
     """Convert kWh to Joules."""
-    return kwh * 3_600_000
+    return _apply(Conversion.KWH_TO_JOULES, kwh)
 
 
-def joules_to_kwh(joules: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def joules_to_kwh(joules: ArrayLike) -> ArrayLike:
     """Convert Joules to kWh."""
-    return joules / 3_600_000
+    return _apply(Conversion.JOULES_TO_KWH, joules)
 
 
-def kwh_to_mj(kwh: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kwh_to_mj(kwh: ArrayLike) -> ArrayLike:
     """Convert kWh to MJ (megajoules)."""
-    return kwh * 3.6
+    return _apply(Conversion.KWH_TO_MJ, kwh)
 
 
-def mj_to_kwh(mj: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def mj_to_kwh(mj: ArrayLike) -> ArrayLike:
     """Convert MJ (megajoules) to kWh."""
-    return mj / 3.6
+    return _apply(Conversion.MJ_TO_KWH, mj)
 
 
-def liter_diesel_to_kwh(liters: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def liter_diesel_to_kwh(liters: ArrayLike) -> ArrayLike:
     """Convert liters of diesel to kWh equivalent energy."""
-    return liters * 10.0  # ~10 kWh per liter
+    return _apply(Conversion.LITER_DIESEL_TO_KWH, liters)
 
 
-def kwh_to_liter_diesel(kwh: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kwh_to_liter_diesel(kwh: ArrayLike) -> ArrayLike:
     """Convert kWh to diesel liter equivalent."""
-    return kwh / 10.0
+    return _apply(Conversion.KWH_TO_LITER_DIESEL, kwh)
 
 
-def kg_h2_to_kwh(kg_h2: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kg_h2_to_kwh(kg_h2: ArrayLike) -> ArrayLike:
     """Convert kg of hydrogen to kWh equivalent energy."""
-    return kg_h2 * 33.3  # ~33.3 kWh per kg H2
+    return _apply(Conversion.KG_H2_TO_KWH, kg_h2)
 
 
-def kwh_to_kg_h2(kwh: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kwh_to_kg_h2(kwh: ArrayLike) -> ArrayLike:
     """Convert kWh to hydrogen kg equivalent."""
-    return kwh / 33.3
+    return _apply(Conversion.KWH_TO_KG_H2, kwh)
 
 
 # Mass conversions
-def kg_to_tonnes(kg: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kg_to_tonnes(kg: ArrayLike) -> ArrayLike:
     """Convert kilograms to metric tonnes."""
-    return kg / 1000.0
+    return _apply(Conversion.KG_TO_TONNES, kg)
 
 
-def tonnes_to_kg(tonnes: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def tonnes_to_kg(tonnes: ArrayLike) -> ArrayLike:
     """Convert metric tonnes to kilograms."""
-    return tonnes * 1000.0
+    return _apply(Conversion.TONNES_TO_KG, tonnes)
 
 
-def kg_to_lbs(kg: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kg_to_lbs(kg: ArrayLike) -> ArrayLike:
     """Convert kilograms to pounds."""
-    return kg * 2.20462
+    return _apply(Conversion.KG_TO_LBS, kg)
 
 
-def lbs_to_kg(lbs: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def lbs_to_kg(lbs: ArrayLike) -> ArrayLike:
     """Convert pounds to kilograms."""
-    return lbs / 2.20462
+    return _apply(Conversion.LBS_TO_KG, lbs)
 
 
 # Temperature conversions
-def celsius_to_fahrenheit(celsius: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def celsius_to_fahrenheit(celsius: ArrayLike) -> ArrayLike:
     """Convert Celsius to Fahrenheit."""
-    return (celsius * 9/5) + 32
+    return _apply(Conversion.CELSIUS_TO_FAHRENHEIT, celsius)
 
 
-def fahrenheit_to_celsius(fahrenheit: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def fahrenheit_to_celsius(fahrenheit: ArrayLike) -> ArrayLike:
     """Convert Fahrenheit to Celsius."""
-    return (fahrenheit - 32) * 5/9
+    return _apply(Conversion.FAHRENHEIT_TO_CELSIUS, fahrenheit)
 
 
-def celsius_to_kelvin(celsius: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def celsius_to_kelvin(celsius: ArrayLike) -> ArrayLike:
     """Convert Celsius to Kelvin."""
-    return celsius + 273.15
+    return _apply(Conversion.CELSIUS_TO_KELVIN, celsius)
 
 
-def kelvin_to_celsius(kelvin: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kelvin_to_celsius(kelvin: ArrayLike) -> ArrayLike:
     """Convert Kelvin to Celsius."""
-    return kelvin - 273.15
+    return _apply(Conversion.KELVIN_TO_CELSIUS, kelvin)
 
 
 # Power conversions
-def kw_to_hp(kw: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def kw_to_hp(kw: ArrayLike) -> ArrayLike:
     """Convert kilowatts to horsepower."""
-    return kw * 1.34102
+    return _apply(Conversion.KW_TO_HP, kw)
 
 
-def hp_to_kw(hp: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def hp_to_kw(hp: ArrayLike) -> ArrayLike:
     """Convert horsepower to kilowatts."""
-    return hp / 1.34102
+    return _apply(Conversion.HP_TO_KW, hp)
 
 
 # Pressure conversions
-def bar_to_psi(bar: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def bar_to_psi(bar: ArrayLike) -> ArrayLike:
     """Convert bar to PSI."""
-    return bar * 14.5038
+    return _apply(Conversion.BAR_TO_PSI, bar)
 
 
-def psi_to_bar(psi: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def psi_to_bar(psi: ArrayLike) -> ArrayLike:
     """Convert PSI to bar."""
-    return psi / 14.5038
+    return _apply(Conversion.PSI_TO_BAR, psi)
 
 
 # Volume conversions
-def liters_to_gallons_us(liters: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def liters_to_gallons_us(liters: ArrayLike) -> ArrayLike:
     """Convert liters to US gallons."""
-    return liters * 0.264172
+    return _apply(Conversion.LITERS_TO_GALLONS_US, liters)
 
 
-def gallons_us_to_liters(gallons: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def gallons_us_to_liters(gallons: ArrayLike) -> ArrayLike:
     """Convert US gallons to liters."""
-    return gallons / 0.264172
+    return _apply(Conversion.GALLONS_US_TO_LITERS, gallons)
 
 
 # Area conversions
-def m2_to_ft2(m2: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def m2_to_ft2(m2: ArrayLike) -> ArrayLike:
     """Convert square meters to square feet."""
-    return m2 * 10.7639
+    return _apply(Conversion.M2_TO_FT2, m2)
 
 
-def ft2_to_m2(ft2: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def ft2_to_m2(ft2: ArrayLike) -> ArrayLike:
     """Convert square feet to square meters."""
-    return ft2 / 10.7639
+    return _apply(Conversion.FT2_TO_M2, ft2)
 
 
-# Financial conversions (percentage)
-def decimal_to_percentage(decimal: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+# Financial conversions
+def decimal_to_percentage(decimal: ArrayLike) -> ArrayLike:
     """Convert decimal to percentage (0.05 -> 5)."""
-    return decimal * 100
+    return _apply(Conversion.DECIMAL_TO_PERCENTAGE, decimal)
 
 
-def percentage_to_decimal(percentage: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+def percentage_to_decimal(percentage: ArrayLike) -> ArrayLike:
     """Convert percentage to decimal (5 -> 0.05)."""
-    return percentage / 100
+    return _apply(Conversion.PERCENTAGE_TO_DECIMAL, percentage)
 
 
 __all__ = [
+    "Conversion",
+    "convert",
     # Distance
     "km_to_miles",
     "miles_to_km",
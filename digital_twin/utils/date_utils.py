@@ -5,12 +5,28 @@ This module provides utilities for date arithmetic and time-based calculations.
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List
 import numpy as np
 
+# Step per frequency code; months and years are fixed 30/365-day steps
+_FREQ_STEPS = {
+    "D": timedelta(days=1),
+    "M": timedelta(days=30),
+    "Y": timedelta(days=365),
+}
 
-def add_years(date: datetime, years: int) -> datetime:
-    """Add years to a date."""
+
+@lru_cache(maxsize=2048, typed=True)
+def _add_years(date: datetime, tzinfo, years: int) -> datetime:
+    """
+    Memoized add_years body.
+
+    Equal datetimes in different timezones (or a pandas Timestamp and its
+    datetime twin) hash alike, so tzinfo is part of the key and typed=True
+    keeps the result type; the cached value is always built from an
+    identical input.
+    """
     try:
         return date.replace(year=date.year + years)
     except ValueError:
@@ -18,6 +34,14 @@ def add_years(date: datetime, years: int) -> datetime:
         return date.replace(year=date.year + years, day=28)
 
 
+def add_years(date: datetime, years: int) -> datetime:
+    """Add years to a date."""
+    return _add_years(date, getattr(date, "tzinfo", None), years)
+
+
+# Depends only on the elapsed time, so equal-but-differently-typed inputs
+# can safely share an entry
+@lru_cache(maxsize=2048)
 def years_between(start_date: datetime, end_date: datetime) -> float:
     """Calculate years between two dates."""
     delta = end_date - start_date
@@ -46,23 +70,32 @@ def generate_date_range(
     list
         List of datetime objects
     """
-    dates = []
-    current = start_date
-
-    if freq == "D":
-        step = timedelta(days=1)
-    elif freq == "M":
-        step = timedelta(days=30)
-    elif freq == "Y":
-        step = timedelta(days=365)
-    else:
+    step = _FREQ_STEPS.get(freq)
+    if step is None:
         raise ValueError(f"Unknown frequency: {freq}")
 
-    while current <= end_date:
-        dates.append(current)
-        current += step
-
-    return dates
+    if (
+        type(start_date) is not datetime
+        or type(end_date) is not datetime
+        or start_date.tzinfo is not None
+        or end_date.tzinfo is not None
+    ):
+        # numpy datetime64 is naive-only; keep plain arithmetic for
+        # timezone-aware datetimes, date objects and datetime subclasses
+        dates = []
+        current = start_date
+        while current <= end_date:
+            dates.append(current)
+            current += step
+        return dates
+
+    # One C-level arange at microsecond resolution (datetime's own
+    # precision) instead of a Python append loop
+    return np.arange(
+        np.datetime64(start_date, "us"),
+        np.datetime64(end_date, "us") + 1,
+        np.timedelta64(step),
+    ).tolist()
 
 
 def operating_days_in_period(
@@ -4,9 +4,28 @@ Output formatting utilities.
 This module provides utilities for formatting numbers, currencies, and reports.
 """
 
-from typing import Union, Optional
+from functools import lru_cache
+from typing import Callable, Union, Optional
 import numpy as np
 
+# Magnitude buckets for format_large_number_array: thresholds, divisors, suffixes
+_LARGE_THRESHOLDS = np.array([1e3, 1e6, 1e9])
+_LARGE_DIVISORS = np.array([1.0, 1e3, 1e6, 1e9])
+_LARGE_SUFFIXES = np.array(["", "K", "M", "B"])
+
+
+@lru_cache(maxsize=32)
+def _number_formatter(decimals: int, thousands_sep: bool = True) -> Callable[[float], str]:
+    """Bound str.format for a fixed precision, built once per spec."""
+    sep = "," if thousands_sep else ""
+    return f"{{:{sep}.{decimals}f}}".format
+
+
+@lru_cache(maxsize=32)
+def _percentage_formatter(decimals: int) -> Callable[[float], str]:
+    """Bound str.format for a percentage with fixed precision."""
+    return f"{{:.{decimals}f}}%".format
+
 
 def format_currency(
     amount: Union[float, int],
@@ -31,10 +50,47 @@ def format_currency(
         Formatted currency string
     """
     symbol = "$" if currency == "AUD" else currency
+    fmt = _number_formatter(decimals)
     if amount >= 0:
-        return f"{symbol}{amount:,.{decimals}f}"
+        return symbol + fmt(amount)
     else:
-        return f"-{symbol}{abs(amount):,.{decimals}f}"
+        return "-" + symbol + fmt(abs(amount))
+
+
+def format_currency_array(
+    values: np.ndarray,
+    currency: str = "AUD",
+    decimals: int = 0
+) -> np.ndarray:
+    """
+    Format a column of amounts as currency.
+
+    Array counterpart of format_currency: the sign/symbol prefix is chosen
+    for the whole column at once and every amount goes through the same
+    cached format spec.
+
+    Parameters
+    ----------
+    values : ndarray
+        Amounts to format
+    currency : str
+        Currency code (default: "AUD")
+    decimals : int
+        Number of decimal places (default: 0)
+
+    Returns
+    -------
+    ndarray
+        Formatted currency strings, same shape as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    symbol = "$" if currency == "AUD" else currency
+    prefixes = np.where(values >= 0, symbol, "-" + symbol)
+
+    # Thousands separators are not supported by numpy.char.mod
+    fmt = _number_formatter(decimals)
+    digits = [fmt(v) for v in np.abs(values).ravel().tolist()]
+    return np.char.add(prefixes, np.array(digits, dtype=str).reshape(values.shape))
 
 
 def format_percentage(
@@ -56,7 +112,7 @@ def format_percentage(
     str
         Formatted percentage string
     """
-    return f"{value * 100:.{decimals}f}%"
+    return _percentage_formatter(decimals)(value * 100)
 
 
 def format_number(
@@ -81,10 +137,7 @@ def format_number(
     str
         Formatted number string
     """
-    if thousands_sep:
-        return f"{value:,.{decimals}f}"
-    else:
-        return f"{value:.{decimals}f}"
+    return _number_formatter(decimals, thousands_sep)(value)
 
 
 def format_large_number(value: Union[float, int], decimals: int = 1) -> str:
@@ -116,6 +169,35 @@ def format_large_number(value: Union[float, int], decimals: int = 1) -> str:
         return f"{sign}{abs_value:.{decimals}f}"
 
 
+def format_large_number_array(values: np.ndarray, decimals: int = 1) -> np.ndarray:
+    """
+    Format a column of large numbers with K, M, B suffix.
+
+    Array counterpart of format_large_number: the magnitude bucket of every
+    element is found with one searchsorted and the strings are built with
+    numpy.char, so a whole column is formatted without a per-cell branch.
+
+    Parameters
+    ----------
+    values : ndarray
+        Values to format
+    decimals : int
+        Number of decimal places
+
+    Returns
+    -------
+    ndarray
+        Formatted strings, same shape as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    abs_values = np.abs(values)
+    bucket = np.searchsorted(_LARGE_THRESHOLDS, abs_values, side="right")
+
+    digits = np.char.mod(f"%.{decimals}f", abs_values / _LARGE_DIVISORS[bucket])
+    signs = np.where(values < 0, "-", "")
+    return np.char.add(np.char.add(signs, digits), _LARGE_SUFFIXES[bucket])
+
+
 def format_distance(km: Union[float, int], unit: str = "km") -> str:
     """
     Format distance with unit.
@@ -183,12 +265,45 @@ def format_co2(kg_co2: Union[float, int]) -> str:
         return f"{kg_co2:,.0f} kg CO₂"
 
 
+def format_co2_array(kg_co2: np.ndarray) -> np.ndarray:
+    """
+    Format a column of CO2 emissions.
+
+    Array counterpart of format_co2; the kg/tonne split is computed for the
+    whole column at once.
+
+    Parameters
+    ----------
+    kg_co2 : ndarray
+        CO2 in kilograms
+
+    Returns
+    -------
+    ndarray
+        Formatted strings, same shape as kg_co2
+    """
+    kg_co2 = np.asarray(kg_co2, dtype=np.float64)
+    in_tonnes = kg_co2 >= 1000
+    scaled = np.where(in_tonnes, kg_co2 / 1000, kg_co2)
+
+    # Thousands separators are not supported by numpy.char.mod
+    fmt_kg, fmt_t = _number_formatter(0), _number_formatter(1)
+    formatted = [
+        fmt_t(v) + " t CO₂" if t else fmt_kg(v) + " kg CO₂"
+        for v, t in zip(scaled.ravel().tolist(), in_tonnes.ravel().tolist())
+    ]
+    return np.array(formatted, dtype=str).reshape(kg_co2.shape)
+
+
 __all__ = [
     "format_currency",
+    "format_currency_array",
     "format_percentage",
     "format_number",
     "format_large_number",
+    "format_large_number_array",
     "format_distance",
     "format_energy",
     "format_co2",
+    "format_co2_array",
 ]
@@ -5,9 +5,26 @@ This module provides utility functions for interpolation, numerical methods,
 and common mathematical operations.
 """
 
+import math
+from bisect import bisect_right
 import numpy as np
-from typing import List, Tuple, Callable, Optional
-from scipy import interpolate
+from typing import List, Sequence, Tuple, Callable, Optional, Union
+
+
+def _interp_scalar(x: float, xp: Sequence[float], fp: Sequence[float]) -> float:
+    """np.interp for one float query on plain sequences, without the C-call overhead."""
+    if len(xp) == 1:
+        return fp[0]
+    if math.isnan(x):
+        return math.nan
+    if x <= xp[0]:
+        return fp[0]
+    if x >= xp[-1]:
+        return fp[-1]
+    j = bisect_right(xp, x) - 1
+    # Same expression order as np.interp, so results are bit-identical
+    slope = (fp[j + 1] - fp[j]) / (xp[j + 1] - xp[j])
+    return slope * (x - xp[j]) + fp[j]
 
 
 def linear_interpolate(
@@ -32,9 +49,80 @@ def linear_interpolate(
     float
         Interpolated value
     """
+    # Scalar query on small list/tuple tables: a bisect beats np.interp's
+    # argument conversion and C dispatch
+    if (
+        type(x) in (float, int)
+        and type(x_points) in (list, tuple)
+        and type(y_points) in (list, tuple)
+        and x_points
+        and len(x_points) == len(y_points)
+    ):
+        return float(_interp_scalar(x, x_points, y_points))
     return np.interp(x, x_points, y_points)
 
 
+def build_spline(
+    x_points: np.ndarray,
+    y_points: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precompute cubic spline coefficients for a fixed set of knots.
+
+    The tridiagonal solve happens once here; evaluate repeatedly with
+    eval_spline when the same knots are reused across scenarios.
+
+    Parameters
+    ----------
+    x_points : ndarray
+        Known x coordinates (strictly increasing)
+    y_points : ndarray
+        Known y coordinates
+
+    Returns
+    -------
+    tuple
+        (x_points, coeffs) where coeffs has shape (4, n-1, ...) with the
+        highest-order coefficient first, as in scipy's CubicSpline.c
+    """
+    # scipy.interpolate costs ~0.25 s to import; only pay for it when a
+    # spline is actually requested
+    from scipy.interpolate import CubicSpline
+
+    cs = CubicSpline(x_points, y_points)
+    return cs.x, cs.c
+
+
+def eval_spline(x: np.ndarray, spline: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """
+    Evaluate a spline from build_spline at x.
+
+    Locates each point's interval with one searchsorted and evaluates the
+    cubic in Horner form; points outside the knots are extrapolated from
+    the end intervals, as CubicSpline does.
+
+    Parameters
+    ----------
+    x : ndarray
+        Points at which to interpolate
+    spline : tuple
+        (x_points, coeffs) as returned by build_spline
+
+    Returns
+    -------
+    ndarray
+        Interpolated values
+    """
+    x_points, coeffs = spline
+    x = np.asarray(x, dtype=np.float64)
+    i = np.clip(np.searchsorted(x_points, x, side="right") - 1, 0, len(x_points) - 2)
+    dx = x - x_points[i]
+    # Broadcast dx over any trailing dimensions of y
+    dx = dx.reshape(dx.shape + (1,) * (coeffs.ndim - 2))
+    c3, c2, c1, c0 = coeffs[0, i], coeffs[1, i], coeffs[2, i], coeffs[3, i]
+    return ((c3 * dx + c2) * dx + c1) * dx + c0
+
+
 def cubic_spline_interpolate(
     x: np.ndarray,
     x_points: np.ndarray,
@@ -57,8 +145,7 @@ def cubic_spline_interpolate(
     ndarray
         Interpolated values
     """
-    cs = interpolate.CubicSpline(x_points, y_points)
-    return cs(x)
+    return eval_spline(x, build_spline(x_points, y_points))
 
 
 def moving_average(data: np.ndarray, window: int) -> np.ndarray:
@@ -77,7 +164,14 @@ def moving_average(data: np.ndarray, window: int) -> np.ndarray:
     ndarray
         Moving average values
     """
-    return np.convolve(data, np.ones(window) / window, mode='valid')
+    # Prefix-sum window: O(N) regardless of window size
+    data = np.asarray(data, dtype=np.float64)
+    csum = np.empty(data.size + 1, dtype=np.float64)
+    csum[0] = 0.0
+    np.cumsum(data, out=csum[1:])
+    averages = np.subtract(csum[window:], csum[:-window])
+    averages *= 1.0 / window
+    return averages
 
 
 def exponential_decay(
@@ -124,18 +218,24 @@ def calculate_gradient(
     ndarray
         Gradient at each point (radians)
     """
-    # Calculate rise over run
-    rise = np.diff(elevation)
-    run = np.diff(distance)
+    distance = np.asarray(distance, dtype=np.float64)
+    elevation = np.asarray(elevation, dtype=np.float64)
+
+    # Single output buffer: rise, rise/run and arctan are written in place
+    gradient = np.empty(elevation.shape, dtype=np.float64)
+    segment = gradient[1:]
+    np.subtract(elevation[1:], elevation[:-1], out=segment)
 
     # Avoid division by zero
-    run = np.where(run == 0, 1e-10, run)
+    run = np.diff(distance)
+    run[run == 0] = 1e-10
 
     # Calculate angle in radians
-    gradient = np.arctan(rise / run)
+    np.divide(segment, run, out=segment)
+    np.arctan(segment, out=segment)
 
     # Pad to original length
-    gradient = np.concatenate([[gradient[0]], gradient])
+    gradient[0] = gradient[1]
 
     return gradient
 
@@ -195,7 +295,16 @@ def weighted_average(
     float
         Weighted average
     """
-    return np.average(values, weights=weights)
+    values = np.asarray(values, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    if values.ndim != 1 or values.shape != weights.shape:
+        return np.average(values, weights=weights)
+
+    # One BLAS dot product instead of np.average's values*weights temporary
+    total = weights.sum()
+    if total == 0:
+        raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+    return float(values @ weights) / float(total)
 
 
 def compound_growth(
@@ -223,29 +332,56 @@ def compound_growth(
     return initial_value * ((1 + growth_rate) ** periods)
 
 
-def solve_quadratic(a: float, b: float, c: float) -> Tuple[complex, complex]:
+def solve_quadratic(
+    a: float,
+    b: float,
+    c: float
+) -> Tuple[Union[float, complex], Union[float, complex]]:
     """
     Solve quadratic equation ax² + bx + c = 0.
 
+    Real roots are computed in real arithmetic; only a negative
+    discriminant promotes to complex.
+
     Parameters
     ----------
-    a, b, c : float
+    a, b, c : float or ndarray
         Coefficients of quadratic equation
 
     Returns
     -------
     tuple
-        Two roots (may be complex)
+        Two roots: floats (real arrays) when the discriminant is
+        non-negative (everywhere, for arrays), complex otherwise
     """
     discriminant = b**2 - 4*a*c
-    root1 = (-b + np.sqrt(discriminant + 0j)) / (2*a)
-    root2 = (-b - np.sqrt(discriminant + 0j)) / (2*a)
-    return root1, root2
+
+    if isinstance(discriminant, np.ndarray) or not 2*a or math.isnan(discriminant):
+        # Arrays stay real only if every discriminant is non-negative;
+        # a == 0 and NaN keep numpy's inf/nan semantics
+        if np.all(discriminant >= 0):
+            sqrt_disc = np.sqrt(discriminant)
+        else:
+            sqrt_disc = np.sqrt(discriminant + 0j)
+        root1 = (-b + sqrt_disc) / (2*a)
+        root2 = (-b - sqrt_disc) / (2*a)
+        return root1, root2
+
+    two_a = 2*a
+    if discriminant >= 0:
+        sqrt_disc = math.sqrt(discriminant)
+        return (-b + sqrt_disc) / two_a, (-b - sqrt_disc) / two_a
+
+    real = -b / two_a
+    imag = math.sqrt(-discriminant) / two_a
+    return complex(real, imag), complex(real, -imag)
 
 
 __all__ = [
     "linear_interpolate",
     "cubic_spline_interpolate",
+    "build_spline",
+    "eval_spline",
     "moving_average",
     "exponential_decay",
     "calculate_gradient",
@@ -13,28 +13,48 @@ def is_numeric(value: Any) -> bool:
     return isinstance(value, (int, float, np.number))
 
 
-def is_positive(value: Union[float, int]) -> bool:
-    """Check if value is positive."""
+def _is_numeric_array(value: Any) -> bool:
+    """Check if value is an ndarray with a numeric dtype."""
+    return isinstance(value, np.ndarray) and np.issubdtype(value.dtype, np.number)
+
+
+def _all_in_range(values: np.ndarray, min_val: float, max_val: float) -> bool:
+    """Check every element of a numeric array lies in [min_val, max_val]."""
+    return bool(np.all((values >= min_val) & (values <= max_val)))
+
+
+def is_positive(value: Union[float, int, np.ndarray]) -> bool:
+    """Check if value (or every element of an array) is positive."""
+    if isinstance(value, np.ndarray):
+        return _is_numeric_array(value) and bool(np.all(value > 0))
     return is_numeric(value) and value > 0
 
 
-def is_non_negative(value: Union[float, int]) -> bool:
-    """Check if value is non-negative."""
+def is_non_negative(value: Union[float, int, np.ndarray]) -> bool:
+    """Check if value (or every element of an array) is non-negative."""
+    if isinstance(value, np.ndarray):
+        return _is_numeric_array(value) and bool(np.all(value >= 0))
     return is_numeric(value) and value >= 0
 
 
-def is_percentage(value: Union[float, int]) -> bool:
-    """Check if value is a valid percentage (0-100)."""
-    return is_numeric(value) and 0 <= value <= 100
+def is_percentage(value: Union[float, int, np.ndarray]) -> bool:
+    """Check if value (or every element of an array) is a valid percentage (0-100)."""
+    return is_in_range(value, 0, 100)
 
 
-def is_decimal_percentage(value: Union[float, int]) -> bool:
-    """Check if value is a valid decimal percentage (0-1)."""
-    return is_numeric(value) and 0 <= value <= 1
+def is_decimal_percentage(value: Union[float, int, np.ndarray]) -> bool:
+    """Check if value (or every element of an array) is a valid decimal percentage (0-1)."""
+    return is_in_range(value, 0, 1)
 
 
-def is_in_range(value: Union[float, int], min_val: float, max_val: float) -> bool:
-    """Check if value is within range."""
+def is_in_range(
+    value: Union[float, int, np.ndarray],
+    min_val: float,
+    max_val: float
+) -> bool:
+    """Check if value (or every element of an array) is within range."""
+    if isinstance(value, np.ndarray):
+        return _is_numeric_array(value) and _all_in_range(value, min_val, max_val)
     return is_numeric(value) and min_val <= value <= max_val
 
 
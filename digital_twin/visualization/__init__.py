@@ -1,11 +1,43 @@
 """Visualization module - Interface layer."""
 
-from digital_twin.visualization.charts import create_bar_chart, create_line_chart
-from digital_twin.visualization.dashboards import create_dashboard
-from digital_twin.visualization.reports import generate_full_report
-from digital_twin.visualization.exports import export_to_excel, export_to_csv
+import importlib
+
+# Public name -> defining submodule. Submodules (and matplotlib/pandas with
+# them) are imported on first attribute access (PEP 562).
+_LAZY = {
+    "create_bar_chart": "digital_twin.visualization.charts",
+    "create_line_chart": "digital_twin.visualization.charts",
+    "release_fig": "digital_twin.visualization.charts",
+    "create_dashboard": "digital_twin.visualization.dashboards",
+    "generate_full_report": "digital_twin.visualization.reports",
+    "export_to_excel": "digital_twin.visualization.exports",
+    "export_to_csv": "digital_twin.visualization.exports",
+}
 
 __all__ = [
-    "create_bar_chart", "create_line_chart", "create_dashboard",
+    "create_bar_chart", "create_line_chart", "release_fig", "create_dashboard",
     "generate_full_report", "export_to_excel", "export_to_csv",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY.get(name)
+    if module_path is not None:
+        value = getattr(importlib.import_module(module_path), name)
+    else:
+        # Not-yet-imported submodules stay reachable as attributes
+        submodule = f"{__name__}.{name}"
+        try:
+            value = importlib.import_module(submodule)
+        except ModuleNotFoundError as exc:
+            if exc.name != submodule:
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,23 +1,69 @@
 """Plotly/Matplotlib chart generation."""
 
-import matplotlib.pyplot as plt
+from typing import List, Tuple
+
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Released figures kept for reuse; building a Figure/Axes dominates the cost
+# of rendering many small dashboard charts
+_FIG_POOL: List[Figure] = []
+_FIG_POOL_MAX = 8
+
+
+def _get_fig() -> Tuple[Figure, Axes]:
+    """
+    Take a figure from the pool, or create one, with a single fresh axes.
+
+    Pooled figures are fully cleared and resized on checkout, so colorbars,
+    extra axes, suptitles or a size set by a previous user do not leak into
+    the next chart.
+
+    Figures are built directly on an Agg canvas rather than through
+    pyplot, so charts never touch pyplot's global figure registry or the
+    GUI backend selection, and the caller's backend is left alone.
+    """
+    if _FIG_POOL:
+        fig = _FIG_POOL.pop()
+        fig.clf()
+        fig.set_size_inches(10, 6)
+    else:
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111)
+
+
+def release_fig(fig: Figure) -> None:
+    """
+    Return a chart figure to the pool once it has been saved or shown.
+
+    The caller must not use the figure afterwards; it is cleared and handed
+    out again by the next create_*_chart call. Figures beyond the pool
+    size, and figures already in the pool, are dropped.
+    """
+    if len(_FIG_POOL) >= _FIG_POOL_MAX or any(f is fig for f in _FIG_POOL):
+        return
+    _FIG_POOL.append(fig)
 
 
-def create_bar_chart(data: dict, title: str = "Chart") -> plt.Figure:
+def create_bar_chart(data: dict, title: str = "Chart") -> Figure:
     """Create bar chart."""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.bar(data.keys(), data.values())
+    fig, ax = _get_fig()
+    keys = np.asarray(list(data))
+    values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+    ax.bar(keys, values)
     ax.set_title(title)
     return fig
 
 
-def create_line_chart(x: np.ndarray, y: np.ndarray, title: str = "Chart") -> plt.Figure:
+def create_line_chart(x: np.ndarray, y: np.ndarray, title: str = "Chart") -> Figure:
     """Create line chart."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _get_fig()
     ax.plot(x, y)
     ax.set_title(title)
     return fig
 
 
-__all__ = ["create_bar_chart", "create_line_chart"]
+__all__ = ["create_bar_chart", "create_line_chart", "release_fig"]
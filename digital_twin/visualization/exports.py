@@ -2,16 +2,81 @@
 
 import pandas as pd
 
+# pandas' own header style and datetime format, so output looks the same
+# whichever writer produced it
+_HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+_DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+
 
 def export_to_excel(data: dict, filename: str) -> None:
-    """Export data to Excel."""
+    """
+    Export data to Excel.
+
+    Uses xlsxwriter's constant-memory mode when it is installed: rows are
+    streamed to disk one at a time, so memory stays flat for large exports.
+    Without xlsxwriter this falls back to pandas' default Excel engine.
+    """
     df = pd.DataFrame(data)
-    df.to_excel(filename, index=False)
+    try:
+        import xlsxwriter
+    except ImportError:
+        df.to_excel(filename, index=False)
+        return
+
+    # Constant-memory mode only accepts row-major writes, which pandas'
+    # column-major cell generator does not do, so rows are written here.
+    # Missing values become None so they are left blank, as pandas does.
+    body = df.astype(object).where(df.notna(), None)
+
+    workbook = xlsxwriter.Workbook(
+        filename,
+        {"constant_memory": True, "default_date_format": _DATETIME_FORMAT},
+    )
+    try:
+        worksheet = workbook.add_worksheet("Sheet1")
+        header_format = workbook.add_format(_HEADER_FORMAT)
+        worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+        for row_idx, row in enumerate(body.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_idx, 0, row)
+    finally:
+        workbook.close()
 
 
-def export_to_csv(data: dict, filename: str) -> None:
-    """Export data to CSV."""
+def export_to_csv(data: dict, filename: str, engine: str = "pandas") -> None:
+    """
+    Export data to CSV.
+
+    Parameters
+    ----------
+    data : dict
+        Column name -> values
+    filename : str
+        Output path
+    engine : str
+        "pandas" (default) or "pyarrow". The pyarrow writer formats and
+        streams whole columns in C and is several times faster on large
+        numeric dumps, but its text differs from pandas': strings and
+        headers are quoted, booleans are lower-case and integral floats
+        are written without ".0". Falls back to pandas if pyarrow is not
+        installed.
+    """
+    if engine not in ("pandas", "pyarrow"):
+        raise ValueError(f"Unknown CSV engine: {engine}")
+
     df = pd.DataFrame(data)
+    if engine == "pyarrow":
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pcsv
+        except ImportError:
+            pass
+        else:
+            # from_pandas maps NaN to null, which is written as an empty
+            # field as pandas does
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pcsv.write_csv(table, filename, pcsv.WriteOptions(batch_size=65536))
+            return
+
     df.to_csv(filename, index=False)
 
 
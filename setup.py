@@ -52,6 +52,12 @@ setup(
             "ipywidgets>=7.6.0",
             "kaleido>=0.2.0",
         ],
+        "excel": [
+            "xlsxwriter>=1.2.0",
+        ],
+        "arrow": [
+            "pyarrow>=7.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
@@ -59,6 +65,12 @@ setup(
             "flake8>=4.0.0",
             "mypy>=0.950",
         ],
+        "all": [
+            "digital-twin[notebook]",
+            "digital-twin[excel]",
+            "digital-twin[arrow]",
+            "digital-twin[dev]",
+        ],
     },
     keywords=(
         "fleet decarbonization monte-carlo risk-analysis digital-twin "
@@ -0,0 +1,157 @@
+"""Tests for the fleet technology-mix and composition optimizers."""
+
+import numpy as np
+import pytest
+
+from digital_twin.optimization import (
+    optimize_fleet_composition,
+    optimize_technology_mix,
+    optimize_technology_mix_batch,
+    optimize_technology_mix_trajectory,
+)
+
+TECHNOLOGIES = ['bev', 'fcet', 'diesel']
+
+
+@pytest.fixture
+def mix_inputs():
+    """Single-period inputs in which BEV is the cheapest technology."""
+    return dict(
+        capital_costs=np.array([100000.0, 500000.0, 200000.0]),
+        maintenance_costs=np.array([10000.0, 25000.0, 40000.0]),
+        degradation_costs=np.array([5000.0, 18000.0, 10000.0]),
+        range_requirements=np.array([150.0, 150.0, 150.0]),
+        vehicle_ranges=np.array([200.0, 250.0, 400.0]),
+        load_capacities=np.array([1.0, 1.0, 1.0]),
+        total_demand=100.0,
+        charging_infrastructure=1000,
+    )
+
+
+def test_range_infeasible_technology_is_bounded_to_zero(mix_inputs):
+    mix_inputs['vehicle_ranges'] = np.array([100.0, 250.0, 400.0])
+
+    mix = optimize_technology_mix(TECHNOLOGIES, **mix_inputs)
+
+    assert mix['bev'] == 0.0
+    assert mix['diesel'] == pytest.approx(1.0)
+
+
+def test_no_range_feasible_technology_raises(mix_inputs):
+    mix_inputs['vehicle_ranges'] = np.array([100.0, 100.0, 100.0])
+
+    with pytest.raises(ValueError, match="range requirements"):
+        optimize_technology_mix(TECHNOLOGIES, **mix_inputs)
+
+
+def test_charging_infrastructure_caps_bev_and_diesel_covers_the_rest(mix_inputs):
+    mix_inputs['charging_infrastructure'] = 30
+
+    mix = optimize_technology_mix(TECHNOLOGIES, **mix_inputs)
+
+    assert mix['bev'] == pytest.approx(0.3)
+    assert mix['fcet'] == 0.0
+    assert mix['diesel'] == pytest.approx(0.7)
+
+
+def test_cost_ties_go_to_the_technology_listed_first(mix_inputs):
+    mix_inputs['capital_costs'] = np.array([200000.0, 200000.0, 200000.0])
+    mix_inputs['maintenance_costs'] = np.zeros(3)
+    mix_inputs['degradation_costs'] = np.zeros(3)
+
+    assert optimize_technology_mix(TECHNOLOGIES, **mix_inputs) == {
+        'bev': 1.0, 'fcet': 0.0, 'diesel': 0.0
+    }
+    reordered = optimize_technology_mix(['diesel', 'fcet', 'bev'], **mix_inputs)
+    assert reordered == {'diesel': 1.0, 'fcet': 0.0, 'bev': 0.0}
+
+
+def test_shares_are_never_negative_zero(mix_inputs):
+    mix = optimize_technology_mix(TECHNOLOGIES, **mix_inputs)
+
+    assert all(np.copysign(1.0, share) == 1.0 for share in mix.values())
+
+
+def test_trajectory_matches_per_period_solves(mix_inputs):
+    demand = np.array([100.0, 150.0, 200.0])
+    infrastructure = np.array([30, 120, 300])
+    trajectory_inputs = dict(
+        mix_inputs, total_demand=demand, charging_infrastructure=infrastructure
+    )
+
+    mixes = optimize_technology_mix_trajectory(TECHNOLOGIES, **trajectory_inputs)
+
+    assert len(mixes) == len(demand)
+    for mix, d, infra in zip(mixes, demand, infrastructure):
+        single = optimize_technology_mix(
+            TECHNOLOGIES, **dict(mix_inputs, total_demand=d, charging_infrastructure=infra)
+        )
+        assert mix == pytest.approx(single)
+
+
+def test_batch_matches_per_scenario_solves(mix_inputs):
+    scenarios = [
+        dict(mix_inputs, charging_infrastructure=infra, total_demand=demand)
+        for infra, demand in ((30, 100.0), (1000, 100.0), (50, 400.0))
+    ]
+    scenarios[1]['max_adoption'] = np.array([0.6, 1.0, 1.0])
+
+    mixes = optimize_technology_mix_batch(TECHNOLOGIES, scenarios)
+
+    assert len(mixes) == len(scenarios)
+    for mix, scenario in zip(mixes, scenarios):
+        assert mix == pytest.approx(optimize_technology_mix(TECHNOLOGIES, **scenario))
+
+
+def test_batch_of_no_scenarios_is_empty():
+    assert optimize_technology_mix_batch(TECHNOLOGIES, []) == []
+
+
+def test_batch_scenario_missing_keys_raises(mix_inputs):
+    del mix_inputs['total_demand']
+
+    with pytest.raises(ValueError, match="total_demand"):
+        optimize_technology_mix_batch(TECHNOLOGIES, [mix_inputs])
+
+
+def test_fleet_composition_picks_cheapest_technology_without_constraints():
+    costs = np.array([[400000.0, 50000.0], [500000.0, 45000.0], [200000.0, 80000.0]])
+
+    mix = optimize_fleet_composition(costs, {})
+
+    assert mix == {'bev': 0.0, 'fcet': 0.0, 'diesel': 1.0}
+
+
+def test_fleet_composition_respects_adoption_caps():
+    costs = np.array([[400000.0, 50000.0], [500000.0, 45000.0], [200000.0, 80000.0]])
+
+    mix = optimize_fleet_composition(costs, {'max_adoption': [1.0, 1.0, 0.25]})
+
+    assert mix['diesel'] == pytest.approx(0.25)
+    assert mix['bev'] == pytest.approx(0.75)
+    assert mix['fcet'] == 0.0
+
+
+def test_fleet_composition_respects_capital_budget():
+    # Operating costs favour BEV; the budget only affords 40 % of the fleet
+    # as BEV at 400k against diesel at 200k
+    costs = np.array([[400000.0, 0.0], [900000.0, 0.0], [200000.0, 300000.0]])
+    constraints = {'max_budget': 2800000.0, 'fleet_size': 10}
+
+    mix = optimize_fleet_composition(costs, constraints)
+
+    capital = constraints['fleet_size'] * sum(
+        share * cost for share, cost in zip(mix.values(), costs[:, 0])
+    )
+    assert capital <= constraints['max_budget'] * (1 + 1e-9)
+    assert mix['bev'] == pytest.approx(0.4)
+    assert mix['diesel'] == pytest.approx(0.6)
+
+
+def test_fleet_composition_excludes_short_range_technologies():
+    costs = np.array([[100000.0], [500000.0], [200000.0]])
+    constraints = {'min_range': 300.0, 'vehicle_ranges': [200.0, 350.0, 800.0]}
+
+    mix = optimize_fleet_composition(costs, constraints)
+
+    assert mix == {'bev': 0.0, 'fcet': 0.0, 'diesel': 1.0}